@@ -0,0 +1,101 @@
+import random
+import threading
+from Recherche import ContexteRecherche, TempsEcoule
+
+# Nombre de réponses probables de l'adversaire cherchées à l'avance, de la plus probable à la moins probable
+NB_REPONSES = 4
+
+
+class Anticipation:
+    """
+    Classe faisant réfléchir l'IA pendant le tour de l'adversaire (pondering) : dans un thread, elle prévoit les
+    réponses les plus probables de l'adversaire et cherche d'avance le coup de l'IA après chacune. Les résultats
+    servent à choix_coup (paramètre anticipation) ; quand l'adversaire a joué autre chose, la recherche normale
+    profite quand même de la table de transposition remplie entre-temps.
+    Le thread partage la table de transposition globale : il doit être arrêté (arreter) avant toute autre recherche.
+    """
+    def __init__(self, etat, IA_index: int, params: dict, nb_reponses=NB_REPONSES):
+        """
+        Fonction d'initialisation de la classe. etat est la position après le coup de l'IA (l'adversaire a le trait),
+        params les paramètres de choix_coup du niveau de l'IA (au format IA_LEVELS, voir PARAMETRES_CHOIX_COUP).
+        """
+        self.etat = etat.clone()
+        self.IA_index = IA_index
+        # epsilon est tiré par choix_coup au moment de jouer, pas pendant l'anticipation ; les recherches parallèles
+        # ne peuvent pas être interrompues, l'anticipation se fait dans ce processus
+        self.params = {cle: valeur for cle, valeur in params.items() if cle not in ("epsilon", "workers")}
+        self.nb_reponses = nb_reponses
+        self.reponses = {}  # clé de Zobrist de la position -> (coup, score)
+        self._en_cours = None  # clé de la position en cours de recherche
+        self._verrou = threading.Lock()
+        self._arret = threading.Event()  # interrompt la recherche en cours
+        self._fin = threading.Event()  # aucune nouvelle recherche après celle en cours
+        self._thread = threading.Thread(target=self._anticiper, name="anticipation", daemon=True)
+
+    def demarrer(self):
+        """
+        Fonction lançant le thread d'anticipation.
+        """
+        self._thread.start()
+
+    def reponses_probables(self) -> list:
+        """
+        Fonction retournant les coups les plus probables de l'adversaire : ceux qui lui donnent la meilleure évaluation
+        un coup plus loin (avec les poids du niveau de l'IA).
+        """
+        etat = self.etat
+        adversaire = etat.tour
+        poids = tuple(self.params.get(cle, defaut) for cle, defaut in
+                      (("poids_avancer", 1.2), ("poids_bloquer", 0.8), ("poids_murs", 0.1), ("poids_avance", 0.5)))
+        scores = []
+        for coup in etat.get_legal_moves():
+            annulation = etat.do_move(coup)
+            try:
+                scores.append((etat.evaluer(adversaire, *poids), coup))
+            finally:
+                etat.undo_move(annulation)
+        scores.sort(key=lambda score_coup: -score_coup[0])
+        return [coup for _, coup in scores[:self.nb_reponses]]
+
+    def _anticiper(self):
+        """
+        Fonction exécutée par le thread : recherche du coup de l'IA après chaque réponse probable, jusqu'à l'arrêt.
+        """
+        for reponse in self.reponses_probables():
+            if self._fin.is_set():
+                return
+            etat = self.etat.clone()
+            etat.do_move(reponse)
+            if etat.get_winner() is not None:
+                continue
+            cle = etat.get_hash()
+            contexte = ContexteRecherche()
+            contexte.arret = self._arret
+            with self._verrou:
+                self._en_cours = cle
+            try:
+                coup = etat.choix_coup(IA_index=self.IA_index, epsilon=0, contexte=contexte,
+                                       rng=random.Random(cle), **self.params)
+            except TempsEcoule:
+                return
+            with self._verrou:
+                self._en_cours = None
+                # une recherche par approfondissement progressif interrompue rend un coup incomplet : il est ignoré
+                if self._arret.is_set():
+                    return
+                self.reponses[cle] = (coup, contexte.score)
+
+    def arreter(self, etat=None) -> dict:
+        """
+        Fonction arrêtant l'anticipation et retournant les recherches terminées (clé -> (coup, score)).
+        Si etat (la position où l'IA doit jouer) est celle en cours de recherche, cette recherche est menée à son
+        terme, puisqu'elle a de l'avance sur une nouvelle recherche ; sinon elle est interrompue aussitôt.
+        """
+        self._fin.set()
+        with self._verrou:
+            attendre = etat is not None and self._en_cours is not None and self._en_cours == etat.get_hash()
+        if not attendre:
+            self._arret.set()
+        if self._thread.is_alive():
+            self._thread.join()
+        return self.reponses
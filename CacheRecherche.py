@@ -0,0 +1,130 @@
+import os
+import struct
+from functools import lru_cache
+from LivreOuvertures import encoder_coup, decoder_coup
+
+MAGIQUE = b"QCAC"
+VERSION = 1
+# en-tête : magique, version, taille d'une entrée (16 octets)
+ENTETE = struct.Struct("<4sHH8x")
+# entrée : clé (état et profil), clé du profil, valeur, profondeur, borne, type de coup (AUCUN_COUP si pas de coup),
+# x, y (32 octets)
+ENTREE = struct.Struct("<QQdBBBBB3x")
+AUCUN_COUP = 255
+
+# Nombre d'entrées écrites par appel système : une écriture en mode ajout de moins d'une page n'est pas entrelacée
+# avec celles des autres processus
+ENTREES_PAR_ECRITURE = 4096 // ENTREE.size
+
+
+class CacheRecherche:
+    """
+    Classe gérant un cache persistant de résultats de recherche : un fichier auquel on ne fait qu'ajouter des
+    entrées de taille fixe (clé, profil, profondeur, borne, valeur, meilleur coup), lisible et complété par plusieurs
+    processus à la fois. Les entrées lues sont gardées en mémoire (la plus profonde par clé) et sont consultées par
+    la table de transposition quand une clé lui manque (voir brancher).
+    Le profil sépare les poids et les options de recherche (voir cle_profil), pas la graine : des entrées écrites par
+    des parties d'autres graines peuvent changer les coups d'une partie.
+    """
+    def __init__(self, chemin: str, profondeur_min=2):
+        """
+        Fonction d'initialisation de la classe. Seuls les résultats de profondeur >= profondeur_min sont écrits.
+        """
+        self.chemin = chemin
+        self.profondeur_min = profondeur_min
+        self.entrees = {}  # cle -> (profondeur, valeur, borne, meilleur_coup, profil)
+        self._position = ENTETE.size  # octets du fichier déjà lus
+        if not os.path.exists(chemin):
+            self._creer()
+        self.rafraichir()
+
+    def __len__(self):
+        return len(self.entrees)
+
+    def _creer(self):
+        """
+        Fonction créant le fichier avec son en-tête. Il est préparé à côté puis lié sous son nom : si un autre
+        processus l'a créé entre-temps, c'est son fichier qui est gardé.
+        """
+        temporaire = f"{self.chemin}.{os.getpid()}.tmp"
+        with open(temporaire, "wb") as f:
+            f.write(ENTETE.pack(MAGIQUE, VERSION, ENTREE.size))
+        try:
+            os.link(temporaire, self.chemin)
+        except FileExistsError:
+            pass
+        finally:
+            os.remove(temporaire)
+
+    def rafraichir(self) -> int:
+        """
+        Fonction lisant les entrées ajoutées au fichier depuis la dernière lecture (par ce processus ou un autre).
+        Une entrée en cours d'écriture à la fin du fichier est laissée pour la lecture suivante.
+        Retourne le nombre d'entrées lues.
+        """
+        with open(self.chemin, "rb") as f:
+            if self._position == ENTETE.size:
+                entete = f.read(ENTETE.size)
+                if len(entete) < ENTETE.size:
+                    return 0
+                magique, version, taille_entree = ENTETE.unpack(entete)
+                if magique != MAGIQUE or version != VERSION or taille_entree != ENTREE.size:
+                    raise ValueError(f"{self.chemin} n'est pas un cache de recherche (version {VERSION})")
+            f.seek(self._position)
+            donnees = f.read()
+        nb = len(donnees) // ENTREE.size
+        for cle, profil, valeur, profondeur, borne, type_coup, x, y in ENTREE.iter_unpack(donnees[:nb * ENTREE.size]):
+            ancienne = self.entrees.get(cle)
+            if ancienne is None or profondeur >= ancienne[0]:
+                coup = None if type_coup == AUCUN_COUP else decoder_coup(type_coup, x, y)
+                self.entrees[cle] = (profondeur, valeur, borne, coup, profil)
+        self._position += nb * ENTREE.size
+        return nb
+
+    def ajouter(self, resultats: list, profil: int):
+        """
+        Fonction ajoutant au fichier des entrées de table de transposition (cle, profondeur, valeur, borne,
+        meilleur_coup) obtenues avec le profil d'évaluation `profil` (voir cle_profil). Les entrées trop peu
+        profondes et celles déjà connues à une profondeur au moins égale sont ignorées.
+        """
+        # pour une même clé, la dernière entrée la plus profonde est la plus précise
+        derniers = {}
+        for resultat in resultats:
+            cle, profondeur = resultat[0], resultat[1]
+            if profondeur >= self.profondeur_min and (cle not in derniers or profondeur >= derniers[cle][1]):
+                derniers[cle] = resultat
+        nouvelles = []
+        for cle, profondeur, valeur, borne, coup in derniers.values():
+            ancienne = self.entrees.get(cle)
+            if ancienne is not None and ancienne[0] >= profondeur:
+                continue
+            self.entrees[cle] = (profondeur, valeur, borne, coup, profil)
+            type_coup, x, y = (AUCUN_COUP, 0, 0) if coup is None else encoder_coup(coup)
+            nouvelles.append(ENTREE.pack(cle, profil, valeur, profondeur, borne, type_coup, x, y))
+        if not nouvelles:
+            return
+        descripteur = os.open(self.chemin, os.O_WRONLY | os.O_APPEND)
+        try:
+            for i in range(0, len(nouvelles), ENTREES_PAR_ECRITURE):
+                os.write(descripteur, b"".join(nouvelles[i:i + ENTREES_PAR_ECRITURE]))
+        finally:
+            os.close(descripteur)
+
+    def brancher(self, table):
+        """
+        Fonction branchant le cache sur une table de transposition, après avoir lu les entrées ajoutées par les autres
+        processus : une clé absente de la table est cherchée dans le cache au moment où la recherche la lit. Seules les
+        positions rencontrées (donc de la variante et des profils de la partie) sont copiées dans la table, au lieu de
+        tout le cache au début de chaque partie. Les entrées ajoutées ensuite au cache sont aussi visibles.
+        """
+        self.rafraichir()
+        table.secours = self.entrees
+
+
+@lru_cache(maxsize=None)
+def ouvrir_cache(chemin):
+    """
+    Fonction retournant le cache de recherche d'un fichier, ouvert une seule fois par processus (None si chemin vaut
+    None).
+    """
+    return None if chemin is None else CacheRecherche(chemin)
@@ -0,0 +1,99 @@
+try:
+    import numpy as np
+except ImportError:  # NumPy est optionnel : sans lui, minimax évalue les feuilles une par une
+    np = None
+
+
+def disponible() -> bool:
+    """
+    Fonction indiquant si l'évaluation par lots peut être utilisée (NumPy installé).
+    """
+    return np is not None
+
+
+def _bits(valeurs: list, nb_bits: int) -> "np.ndarray":
+    """
+    Fonction convertissant une liste d'entiers (masques de bits) en tableau booléen de forme (N, nb_bits).
+    """
+    nb_octets = (nb_bits + 7) // 8
+    brut = b"".join(v.to_bytes(nb_octets, "little") for v in valeurs)
+    octets = np.frombuffer(brut, dtype=np.uint8).reshape(len(valeurs), nb_octets)
+    return np.unpackbits(octets, axis=1, bitorder="little")[:, :nb_bits].astype(bool)
+
+
+def champs_lot(taille: int, bloque_bas: list, bloque_droite: list, lignes: list) -> "np.ndarray":
+    """
+    Fonction calculant en une fois les champs de distances de N plateaux.
+    bloque_bas / bloque_droite sont les masques de PlateauBits de chaque plateau et lignes[k] l'indice de la ligne
+    (de cases) d'arrivée du plateau k. Le front de chaque plateau avance d'une case par itération en décalant un
+    tableau booléen (N, taille, taille), filtré par les passages ouverts. Retourne un tableau (N, taille, taille)
+    de distances (np.inf si inaccessible).
+    """
+    n = taille
+    nb = len(bloque_bas)
+    ouvert_bas = ~_bits(bloque_bas, n * n).reshape(nb, n, n)[:, :-1, :]  # passage (r, c) <-> (r+1, c)
+    ouvert_droite = ~_bits(bloque_droite, n * n).reshape(nb, n, n)[:, :, :-1]  # passage (r, c) <-> (r, c+1)
+
+    distances = np.full((nb, n, n), np.inf)
+    front = np.zeros((nb, n, n), dtype=bool)
+    front[np.arange(nb), lignes, :] = True
+    atteint = front.copy()
+    d = 0
+    while front.any():
+        distances[front] = d
+        suivant = np.zeros_like(front)
+        suivant[:, 1:, :] |= front[:, :-1, :] & ouvert_bas
+        suivant[:, :-1, :] |= front[:, 1:, :] & ouvert_bas
+        suivant[:, :, 1:] |= front[:, :, :-1] & ouvert_droite
+        suivant[:, :, :-1] |= front[:, :, 1:] & ouvert_droite
+        front = suivant & ~atteint
+        atteint |= front
+        d += 1
+    return distances
+
+
+def evaluer_lot(etat, coups: list, IA_index: int, poids_avancer=1.2, poids_bloquer=0.8, poids_murs=0.1,
+                poids_avance=0.5) -> list:
+    """
+    Fonction retournant le score (au sens de GameState.evaluer) de l'état obtenu après chacun des `coups`,
+    sans jouer les coups. Les déplacements ne changent pas les champs de distances de `etat` (simple lecture) ;
+    les champs de tous les plateaux avec un mur en plus sont calculés ensemble par champs_lot.
+    """
+    plateau = etat.plateau
+    tour = etat.tour
+    joueurs = etat.joueurs
+    champs = etat.champs_distances()
+    positions = [plateau.indice(*j.position) for j in joueurs]
+    distances = [None] * len(coups)
+
+    murs = [k for k, coup in enumerate(coups) if coup[0] == "wall"]
+    if murs:
+        bloque_bas, bloque_droite = [], []
+        for k in murs:
+            _, x, y, ori = coups[k]
+            passages = plateau.passages_mur(x, y, ori)
+            bloque_bas.append(plateau.bloque_bas | passages if ori == "h" else plateau.bloque_bas)
+            bloque_droite.append(plateau.bloque_droite | passages if ori == "v" else plateau.bloque_droite)
+        m = len(murs)
+        # les m plateaux une fois pour la ligne d'arrivée de chaque joueur
+        lignes = [joueurs[0].ligne_obj >> 1] * m + [joueurs[1].ligne_obj >> 1] * m
+        champs_murs = champs_lot(plateau.taille, bloque_bas * 2, bloque_droite * 2, lignes)
+        champs_murs = champs_murs.reshape(2 * m, -1)[:, positions].tolist()
+        for t, k in enumerate(murs):
+            distances[k] = (champs_murs[t][0], champs_murs[m + t][1])
+
+    for k, coup in enumerate(coups):
+        if coup[0] == "move":
+            pos = list(positions)
+            pos[tour] = plateau.indice(*coup[1])
+            distances[k] = (champs[0][pos[0]], champs[1][pos[1]])
+
+    scores = []
+    for k, coup in enumerate(coups):
+        nb_murs = [j.nb_murs for j in joueurs]
+        if coup[0] == "wall" and nb_murs[tour] > 0:
+            nb_murs[tour] -= 1
+        d = distances[k]
+        scores.append(etat.score_evaluation(d[IA_index], d[1 - IA_index], nb_murs[IA_index], nb_murs[1 - IA_index],
+                                            poids_avancer, poids_bloquer, poids_murs, poids_avance))
+    return scores
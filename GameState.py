@@ -1,57 +1,133 @@
-import queue
 import math
+import time
 import random
-import hashlib
 from Object.Plateau import Plateau
+from Object.PlateauBits import PlateauBits
 from Object.Joueur import Joueur
+from Object.EtatCompact import EtatCompact
+from Zobrist import tables_zobrist, tirage
+from TranspositionTable import TranspositionTable, cle_profil, EXACT, LOWER, UPPER
+from Recherche import ContexteRecherche, TempsEcoule
+from RechercheParallele import recherche_racine_parallele
+from Finale import coup_finale
+from MCTS import recherche_mcts
+import EvaluationLot
 
-TRANSPOSITION_TABLE = {}
+# Table de transposition partagée par défaut (taille bornée)
+TRANSPOSITION_TABLE = TranspositionTable()
+
+# Largeur de la fenêtre « nulle » des recherches de vérification de la PVS (les scores sont des flottants)
+FENETRE_NULLE = 1e-6
+# Demi-largeur de la fenêtre d'aspiration autour du score de l'itération précédente
+FENETRE_ASPIRATION = 4.0
+# Late move reductions : nombre de coups cherchés à pleine profondeur avant de réduire les murs suivants, et
+# profondeur minimale restante pour réduire
+LMR_COUPS_COMPLETS = 3
+LMR_PROFONDEUR_MIN = 3
+# Réduction de profondeur de la recherche qui suit un coup nul
+REDUCTION_COUP_NUL = 2
 
 class GameState:
     # classe permettant de gérer toute la partie IA du projet
-    def __init__(self, plateau: Plateau, joueurs: list[Joueur], tour: int):
+    __slots__ = ("plateau", "joueurs", "tour", "graine", "filtre_murs", "_hash", "_champs")
+
+    def __init__(self, plateau: Plateau, joueurs: list[Joueur], tour: int, graine: int = 0, filtre_murs: bool = True):
         """
         Fonction d'initialisation de la classe.
-        """
+        Un Plateau classique est converti en PlateauBits : toute la recherche travaille sur les masques de bits.
+        La graine fixe les choix pseudo-aléatoires de la génération des coups : à graine égale, une position donne
+        toujours la même liste de coups.
+        filtre_murs limite les murs générés aux murs jugés intéressants autour de l'adversaire (voir
+        _verifier_placement_mur) ; sans filtre, get_legal_moves retourne tous les murs légaux.
+        """
+        if not isinstance(plateau, PlateauBits):
+            plateau = PlateauBits.depuis_plateau(plateau, joueurs)
         self.plateau = plateau
         self.joueurs = joueurs
         self.tour = tour
+        self.graine = graine
+        self.filtre_murs = filtre_murs
         self._hash = None
+        self._champs = None
 
-    def get_hash(self) -> str:
+    def get_hash(self) -> int:
         """
-        Fonction permettant de gérer plus facilement la mémoire de l'état du jeu
-        Aide de ChatGPT
+        Fonction retournant la clé de Zobrist (entier 64 bits) de l'état du jeu.
+        Elle n'est calculée entièrement qu'une fois, puis mise à jour en O(1) par do_move / undo_move.
         """
         if self._hash is not None:
             return self._hash
-            
-        state_str = ""
-        for row in self.plateau.matrice:
-            state_str += ''.join(str(cell) for cell in row)
-        for j in self.joueurs:
-            state_str += f"{j.position[0]},{j.position[1]},{j.nb_murs}"
-        state_str += str(self.tour)
-        
-        self._hash = hashlib.md5(state_str.encode()).hexdigest()
+
+        z = tables_zobrist(self.plateau.taille)
+        cle = 0
+        murs_h, murs_v = self.plateau.murs_h, self.plateau.murs_v
+        for s in range(len(z.murs_h)):
+            if murs_h >> s & 1:
+                cle ^= z.murs_h[s]
+            if murs_v >> s & 1:
+                cle ^= z.murs_v[s]
+        for i, j in enumerate(self.joueurs):
+            cle ^= z.pions[i][self.plateau.indice(*j.position)] ^ z.murs_restants[i][j.nb_murs]
+        if self.tour:
+            cle ^= z.trait
+
+        self._hash = cle
         return self._hash
 
+    def compacter(self) -> EtatCompact:
+        """
+        Fonction retournant la position sous forme compacte (EtatCompact) : un entier immuable et hachable.
+        """
+        plateau = self.plateau
+        return EtatCompact.depuis(plateau.taille, plateau.murs_h, plateau.murs_v,
+                                  tuple(plateau.indice(*j.position) for j in self.joueurs),
+                                  tuple(j.nb_murs for j in self.joueurs), self.tour)
+
+    @classmethod
+    def depuis_compact(cls, compact: EtatCompact, graine: int = 0, filtre_murs: bool = True) -> "GameState":
+        """
+        Fonction reconstruisant un état du jeu à partir de sa forme compacte (joueurs "1" et "2" d'une partie normale).
+        """
+        taille, murs_h, murs_v, cases, nb_murs, tour = compact.composantes()
+        plateau = PlateauBits.depuis_murs(taille, murs_h, murs_v)
+        lignes = (2 * taille - 2, 0)
+        joueurs = [Joueur(str(i + 1), plateau.coordonnees(cases[i]), lignes[i], nb_murs[i]) for i in range(2)]
+        for j in joueurs:
+            plateau.placer_joueur(j)
+        return cls(plateau, joueurs, tour, graine, filtre_murs)
+
+    def __reduce__(self):
+        # sérialisation (envoi aux processus d'un pool) : la forme compacte et les paramètres de génération des coups,
+        # les caches sont recalculés
+        return _restaurer_etat, (self.compacter(), self.graine, self.filtre_murs)
+
+    def champs_distances(self) -> list:
+        """
+        Fonction retournant, pour chaque joueur, la distance de toutes les cases à sa ligne d'arrivée.
+        Les champs sont calculés une fois puis mis à jour par do_move quand un mur est posé (les déplacements de
+        pions ne les changent pas). Ils ne sont jamais modifiés sur place, une copie de l'état peut donc les partager.
+        """
+        if self._champs is None:
+            self._champs = [self.plateau.champ_distances(j.ligne_obj) for j in self.joueurs]
+        return self._champs
+
+    def distance_objectif(self, index: int) -> float:
+        """
+        Fonction retournant la distance du joueur `index` à sa ligne d'arrivée (lecture dans son champ de distances).
+        """
+        return self.champs_distances()[index][self.plateau.indice(*self.joueurs[index].position)]
+
     def clone(self) -> "GameState":
         """
         Fonction permettant de clonner l'état du jeu
         Aide de ChatGPT
         """
-        newPlateau = Plateau(self.plateau.taille)
-        dim = len(self.plateau.matrice)
-        for i in range(dim):
-            for j in range(dim):
-                newPlateau.matrice[i][j] = self.plateau.matrice[i][j]
-
+        newPlateau = self.plateau.copie()
         newJoueurs = [Joueur(p.nom, p.position, p.ligne_obj, p.nb_murs) for p in self.joueurs]
-        for j in newJoueurs:
-            newPlateau.placer_joueur(j)
-
-        return GameState(newPlateau, newJoueurs, self.tour)
+        nouveau = GameState(newPlateau, newJoueurs, self.tour, self.graine, self.filtre_murs)
+        nouveau._hash = self._hash
+        nouveau._champs = self._champs
+        return nouveau
 
     def _get_legal_moves_deplacement(self, joueur, x0, y0, dim) -> list:
         """
@@ -69,8 +145,7 @@ class GameState:
                 # verification que l'adresse de destination est sur le plateau.
                 continue
             
-            mx, my = (x0 + x1)//2, (y0 + y1)//2
-            if self.plateau.matrice[mx][my] == Plateau.WALL:
+            if self.plateau.mur_entre(x0, y0, x1, y1):
                 # verification de la présense de murs entre la position de débat et d'arrivée
                 continue
             
@@ -98,8 +173,7 @@ class GameState:
         x2, y2 = x1 + dx, y1 + dy
         
         if 0 <= x2 < dim and 0 <= y2 < dim:
-            mx2, my2 = (x1 + x2)//2, (y1 + y2)//2
-            if self.plateau.matrice[mx2][my2] != Plateau.WALL:
+            if not self.plateau.mur_entre(x1, y1, x2, y2):
                 if not any(p.position == (x2, y2) for p in self.joueurs):
                     moves.append(("move", (x2, y2)))
         return moves
@@ -131,48 +205,112 @@ class GameState:
                     wall_positions.append((wx, wy))
         
         # Ici on limite le nombre de placement de murs dans la liste des proposions. Cela permet d'éviter trop de calcule
-        max_walls = 18
+        # (deux par ligne du plateau : 18 sur 9x9 ; les positions restent autour de l'adversaire quelle que soit
+        # la taille)
+        max_walls = dim + 1
         if len(wall_positions) > max_walls:
             wall_positions = wall_positions[:max_walls]
         
         return wall_positions
     
-    def _verifier_placement_mur(self, x, y, orientation, adversaire, d_adversaire) -> tuple:
+    def _chemins_courts(self) -> list:
+        """
+        Fonction retournant, pour chaque joueur, un plus court chemin vers sa ligne d'arrivée sous forme de masques de
+        passages (vers le bas, vers la droite), lus dans les champs de distances.
+        """
+        return [self.plateau.masques_chemin(champ, j.position)
+                for champ, j in zip(self.champs_distances(), self.joueurs)]
+
+    def _verifier_placement_mur(self, x, y, orientation, adversaire, d_adversaire, chemins=None) -> tuple:
         """
         Cette fonction permet de vérifier le placement d'un mur ainsi que son aspect stratégique.
+        La recherche de chemin n'est faite que si elle peut changer le résultat : un mur qui ne coupe pas le plus court
+        chemin d'un joueur ne change pas sa distance, et un mur qui ne s'appuie pas en deux points sur d'autres murs
+        ou sur le bord ne peut fermer aucun chemin.
         """
-        # Dans ces deux tests nous vérifions s'il y'a un chevaugement de mur ou pas
+        # Dans ces deux tests nous vérifions s'il y'a un chevaugement ou un croisement de mur
         if orientation == "h":
-            if (self.plateau.matrice[x][y-1] == Plateau.WALL or 
-                self.plateau.matrice[x][y+1] == Plateau.WALL):
+            if not self.plateau.est_mur_horizontal_valide(x, y):
                 return (False, None)
         else:
-            if (self.plateau.matrice[x-1][y] == Plateau.WALL or 
-                self.plateau.matrice[x+1][y] == Plateau.WALL):
+            if not self.plateau.est_mur_vertical_valide(x, y):
                 return (False, None)
 
-        # Nous faisons une copie de l'état de la partie.
-        s2 = self.clone()
+        plateau = self.plateau
+        if chemins is None:
+            chemins = self._chemins_courts()
+        # le mur coupe-t-il le plus court chemin actuel de chaque joueur ?
+        passages = plateau.passages_mur(x, y, orientation)
+        sens = 0 if orientation == "h" else 1
+        coupe = [chemin[sens] & passages for chemin in chemins]
+        i_adversaire = self.joueurs.index(adversaire)
+
+        new_d_adv = d_adversaire
+        if any(coupe):
+            # Dans cette partie nous faisons une simulation du placement du mur, directement sur le plateau
+            # (il est retiré ensuite)
+            fermeture = plateau.peut_fermer_chemin(x, y, orientation)
+            plateau.placer_mur(x, y, orientation)
+            try:
+                for i, p in enumerate(self.joueurs):
+                    if not coupe[i]:
+                        continue
+                    if i == i_adversaire:
+                        # Dans cette partie nous vérifions l'éfficacité du placement du mur
+                        # (distance infinie = chemin fermé)
+                        new_d_adv = self.bfs(plateau, p.position, p.ligne_obj)
+                        if new_d_adv == math.inf:
+                            return (False, None)
+                    elif fermeture and not plateau.chemin_existe(p.position, p.ligne_obj):
+                        # Ici nous vérifions que le joueur a encore un chemin vers sa ligne d'arrivée
+                        return (False, None)
+            finally:
+                plateau.retirer_mur(x, y, orientation)
+
+        if new_d_adv > d_adversaire:
+            # On retiens ce positionnement de mur car la distance pour finir la partie pour l'adversaire a augmenté
+            return (True, ("wall", x, y, orientation))
+
+        elif new_d_adv == d_adversaire and self._tirage_mur(x, y, orientation) < 0.3:
+            # Distance vers l'arrivée inchangée pour l'adversaire mais pour plus de diversité selon la valeur du tirage
+            # nous gardons ce placement.
+            return (True, ("wall", x, y, orientation))
 
-        # Dans cette partie nous faisons une simulation du placement du mur
-        if not s2.plateau.placer_mur(x, y, orientation):
-            return (False, None)
-        
-        # Ici nous allons vérifier que les deux joueurs ont encore un chemin vers leur ligne d'arrivée
-        if all(s2.plateau.chemin_existe(p.position, p.ligne_obj) for p in s2.joueurs):
-            # Dans cette partie nous vérifions l'éfficacité du placement du mur
-            new_d_adv = s2.bfs(s2.plateau, adversaire.position, adversaire.ligne_obj)
-            
-            if new_d_adv > d_adversaire:
-                # On retiens ce positionnement de mur car la distance pour finir la partie pour l'adversaire a augmenté
-                return (True, ("wall", x, y, orientation))
-            
-            elif new_d_adv == d_adversaire and random.random() < 0.3:
-                # Distance vers l'arrivée inchangée pour l'adversaire mais pour plus de diversité selon la valeur du random nous gardons ce placement.
-                return (True, ("wall", x, y, orientation))
-            
         return (False, None)
     
+    def _murs_complets(self, chemins) -> list:
+        """
+        Fonction retournant tous les murs légaux : ceux qui ne chevauchent ni ne croisent un mur posé (un ET avec le
+        masque de conflit de l'emplacement) et qui laissent un chemin à chaque joueur. La recherche de chemin n'est
+        faite que pour les murs qui coupent le plus court chemin actuel d'un joueur et s'appuient en deux points.
+        """
+        plateau = self.plateau
+        murs = []
+        for x, y, orientation in plateau.murs_libres():
+            passages = plateau.passages_mur(x, y, orientation)
+            sens = 0 if orientation == "h" else 1
+            coupes = [j for chemin, j in zip(chemins, self.joueurs) if chemin[sens] & passages]
+            if coupes and plateau.peut_fermer_chemin(x, y, orientation):
+                plateau.placer_mur(x, y, orientation)
+                try:
+                    ferme = any(not plateau.chemin_existe(j.position, j.ligne_obj) for j in coupes)
+                finally:
+                    plateau.retirer_mur(x, y, orientation)
+                if ferme:
+                    continue
+            murs.append(("wall", x, y, orientation))
+        return murs
+
+    def _tirage_mur(self, x, y, orientation) -> float:
+        """
+        Fonction retournant le tirage pseudo-aléatoire ([0, 1)) associé à un mur dans cette position.
+        Il est déterminé par la clé de la position, le mur et la graine : la liste des coups d'une position ne dépend
+        ni de l'ordre de parcours de l'arbre ni du processus qui la calcule.
+        """
+        z = tables_zobrist(self.plateau.taille)
+        cle_mur = (z.murs_h if orientation == "h" else z.murs_v)[self.plateau.emplacement(x, y)]
+        return tirage(self.get_hash() ^ cle_mur, self.graine)
+
     def get_legal_moves(self) -> list:
         """
         Fonction retournant la liste des coups possibles à jouer.
@@ -180,23 +318,26 @@ class GameState:
         # Initialisation et récupération des informations nécessaires pour la fonction
         joueur = self.joueurs[self.tour] # Le joueur
         x0, y0 = joueur.position # la postion du joueur
-        dim = len(self.plateau.matrice) # Les dimensions du plateau
+        dim = self.plateau.dim # Les dimensions du plateau
         adversaire = self.joueurs[1 - self.tour] # l'adversaire
         
         moves = self._get_legal_moves_deplacement(joueur, x0, y0, dim)
         
-        if joueur.nb_murs > 0:
+        if joueur.nb_murs > 0 and not self.filtre_murs:
+            # Génération complète : tous les murs légaux
+            moves.extend(self._murs_complets(self._chemins_courts()))
+        elif joueur.nb_murs > 0:
             # Si le joueur a encore des murs en stock nous allons lister la position des murs possible et interessant à jouer
-            d_moi = self.bfs(self.plateau, joueur.position, joueur.ligne_obj)
-            d_adversaire = self.bfs(self.plateau, adversaire.position, adversaire.ligne_obj)
+            d_adversaire = self.distance_objectif(1 - self.tour)
             
             # liste des positions de murs possibles à placé et stratégique.
             wall_positions = self._get_wall_positions(adversaire, dim)
+            chemins = self._chemins_courts()
 
             # verification de la validité du mur
             for x, y in wall_positions:
                 for orientation in ["h", "v"]:
-                    valide, coup = self._verifier_placement_mur(x, y, orientation, adversaire, d_adversaire)
+                    valide, coup = self._verifier_placement_mur(x, y, orientation, adversaire, d_adversaire, chemins)
                     if valide:
                         moves.append(coup)
         
@@ -205,52 +346,150 @@ class GameState:
         
         return move_moves + wall_moves
     
-    def calculer_chemin(self, plateau: Plateau, depart: tuple, arrivee: int) -> list:
+    def calculer_chemin(self, plateau: PlateauBits, depart: tuple, arrivee: int) -> list:
         """
         Fonction permettant de retourner le chemin entre un joueur et sa ligne d'arrivée. Nous utilisons un BFS.
         """
-        visited = {depart}
-        q = queue.Queue()
-        q.put((depart, [depart]))
-        dim = len(plateau.matrice)
-
-        while not q.empty():
-            (x, y), path = q.get()
-            if x == arrivee:
-                return path
-            for dx, dy in [(-2,0),(2,0),(0,-2),(0,2)]:
-                nx, ny = x + dx, y + dy
-                if not (0 <= nx < dim and 0 <= ny < dim):
-                    continue
-                if (nx, ny) in visited:
-                    continue
-                mx, my = (x + nx)//2, (y + ny)//2
-                if plateau.matrice[mx][my] == Plateau.WALL:
-                    continue
-                visited.add((nx, ny))
-                q.put(((nx, ny), path + [(nx, ny)]))
-        return []
+        return plateau.chemin(depart, arrivee)
 
     def apply_move(self, move: tuple) -> "GameState":
         """
-        Cette fonction permet d'appliquer un coup sur le plateau.
+        Cette fonction permet d'appliquer un coup sur une copie de l'état et de retourner cette copie.
         """
         nv = self.clone()
-        tour = nv.tour
-        joueur = nv.joueurs[tour]
+        nv.do_move(move)
+        return nv
+
+    def do_move(self, move: tuple) -> tuple:
+        """
+        Cette fonction applique un coup sur place (sans copie) et retourne le delta nécessaire à undo_move :
+        (coup, tour, ancienne position du pion, mur posé, mur décompté, ancien hash, anciens champs de distances).
+        """
+        tour = self.tour
+        joueur = self.joueurs[tour]
+        plateau = self.plateau
+        ancienne_position = joueur.position
+        mur_pose = mur_utilise = False
+        cle = self._hash
+        anciens_champs = self._champs
+        z = tables_zobrist(plateau.taille)
 
         if move[0] == "move":
+            # Le coup a déjà été validé par get_legal_moves (sauts compris) : on déplace directement le pion.
             _, (x, y) = move
-            joueur.deplacer((x, y), nv.plateau)
+            joueur.position = (x, y)
+            plateau.deplacer_pion(joueur.nom, (x, y))
+            if cle is not None:
+                cle ^= z.pions[tour][plateau.indice(*ancienne_position)] ^ z.pions[tour][plateau.indice(x, y)]
         elif move[0] == "wall":
             _, x, y, ori = move
-            nv.plateau.placer_mur(x, y, ori)
-            joueur.utiliser_mur()
+            mur_pose = plateau.placer_mur(x, y, ori)
+            mur_utilise = joueur.utiliser_mur()
+            if mur_pose and self._champs is not None:
+                # Les champs de distances ne changent qu'avec les murs : mise à jour locale autour du mur posé.
+                aretes = plateau.aretes_mur(x, y, ori)
+                self._champs = [plateau.mettre_a_jour_champ(c, aretes, j.ligne_obj)
+                                for c, j in zip(self._champs, self.joueurs)]
+            if cle is not None:
+                if mur_pose:
+                    cle ^= (z.murs_h if ori == "h" else z.murs_v)[plateau.emplacement(x, y)]
+                if mur_utilise:
+                    cle ^= z.murs_restants[tour][joueur.nb_murs + 1] ^ z.murs_restants[tour][joueur.nb_murs]
         else:
             raise ValueError(f"Coup inconnu: {move}")
 
-        nv.tour = 1 - tour
-        return nv
+        annulation = (move, tour, ancienne_position, mur_pose, mur_utilise, self._hash, anciens_champs)
+        self.tour = 1 - tour
+        self._hash = None if cle is None else cle ^ z.trait
+        return annulation
+
+    def undo_move(self, annulation: tuple):
+        """
+        Cette fonction annule un coup appliqué par do_move à partir du delta qu'il a retourné.
+        """
+        move, tour, ancienne_position, mur_pose, mur_utilise, ancien_hash, anciens_champs = annulation
+        joueur = self.joueurs[tour]
+        if move[0] == "move":
+            joueur.position = ancienne_position
+            self.plateau.deplacer_pion(joueur.nom, ancienne_position)
+        else:
+            _, x, y, ori = move
+            if mur_pose:
+                self.plateau.retirer_mur(x, y, ori)
+            if mur_utilise:
+                joueur.nb_murs += 1
+        self.tour = tour
+        self._hash = ancien_hash
+        self._champs = anciens_champs
+
+    def passer(self) -> tuple:
+        """
+        Fonction donnant le trait à l'adversaire sans jouer (coup nul de la recherche, interdit dans une vraie
+        partie). Elle retourne le delta nécessaire à annuler_passe.
+        """
+        annulation = (self.tour, self._hash)
+        self.tour = 1 - self.tour
+        if self._hash is not None:
+            self._hash ^= tables_zobrist(self.plateau.taille).trait
+        return annulation
+
+    def annuler_passe(self, annulation: tuple):
+        """
+        Fonction annulant un coup nul joué par passer.
+        """
+        self.tour, self._hash = annulation
+
+    def _zugzwang_possible(self) -> bool:
+        """
+        Fonction indiquant si le joueur qui a le trait pourrait préférer passer son tour : sans murs il doit déplacer
+        son pion, éventuellement hors de son plus court chemin, et des pions voisins changent les sauts possibles.
+        Le coup nul n'est pas essayé dans ces positions.
+        """
+        if self.joueurs[self.tour].nb_murs == 0:
+            return True
+        (x0, y0), (x1, y1) = (j.position for j in self.joueurs)
+        return abs(x0 - x1) + abs(y0 - y1) <= 2
+
+    @staticmethod
+    def _reduction_lmr(coup, rang) -> int:
+        """
+        Fonction retournant la réduction de profondeur (late move reductions) d'un coup essayé au rang `rang` :
+        seuls les murs venant après les LMR_COUPS_COMPLETS premiers coups sont réduits, d'un niveau. Les déplacements
+        ne sont jamais réduits.
+        """
+        return 1 if coup[0] == "wall" and rang >= LMR_COUPS_COMPLETS else 0
+
+    def _coupure_coup_nul(self, profondeur, IA_index, alpha, beta, poids, contexte, ply):
+        """
+        Fonction de l'élagage par coup nul : si, même en passant son tour, le joueur qui a le trait dépasse la borne
+        de coupure (recherche réduite de REDUCTION_COUP_NUL et à fenêtre nulle), le noeud est coupé sans chercher
+        ses coups. Retourne le score de coupure, ou None si le noeud doit être cherché normalement.
+        Un seul coup nul par branche, seulement aux noeuds hors variante principale (cherchés à fenêtre nulle, voir
+        pvs) et quand l'évaluation statique dépasse déjà la borne.
+        """
+        maximiser = self.tour == IA_index
+        if contexte.passe or profondeur <= REDUCTION_COUP_NUL or (beta if maximiser else -alpha) == math.inf:
+            return None
+        # noeud de la variante principale : fenêtre ouverte (marge pour les arrondis de alpha + FENETRE_NULLE)
+        if beta - alpha > 2 * FENETRE_NULLE:
+            return None
+        if self._zugzwang_possible():
+            return None
+        statique = self.evaluer(IA_index, *poids)
+        if (statique < beta) if maximiser else (statique > alpha):
+            return None
+        fenetre = (beta - FENETRE_NULLE, beta) if maximiser else (alpha, alpha + FENETRE_NULLE)
+        annulation = self.passer()
+        contexte.passe = True
+        try:
+            score = self.minimax(profondeur - 1 - REDUCTION_COUP_NUL, IA_index, *fenetre, *poids,
+                                 contexte=contexte, ply=ply + 1)
+        finally:
+            contexte.passe = False
+            self.annuler_passe(annulation)
+        if (score >= beta) if maximiser else (score <= alpha):
+            return score
+        return None
 
     def evaluer(self, IA_index: int, poids_avancer=1.2, poids_bloquer=0.8, poids_murs=0.1, 
                poids_avance=0.5) -> float:
@@ -260,9 +499,19 @@ class GameState:
         moi = self.joueurs[IA_index]
         adversaire = self.joueurs[1 - IA_index]
         
-        d_moi = self.bfs(self.plateau, moi.position, moi.ligne_obj) # distance du joueur à la ligne d'arrivée
-        d_adversaire = self.bfs(self.plateau, adversaire.position, adversaire.ligne_obj) # distance de l'adversaire à la ligne d'arrivée
+        d_moi = self.distance_objectif(IA_index) # distance du joueur à la ligne d'arrivée
+        d_adversaire = self.distance_objectif(1 - IA_index) # distance de l'adversaire à la ligne d'arrivée
         
+        return self.score_evaluation(d_moi, d_adversaire, moi.nb_murs, adversaire.nb_murs,
+                                     poids_avancer, poids_bloquer, poids_murs, poids_avance)
+
+    @staticmethod
+    def score_evaluation(d_moi, d_adversaire, murs_moi, murs_adversaire, poids_avancer=1.2, poids_bloquer=0.8,
+                         poids_murs=0.1, poids_avance=0.5) -> float:
+        """
+        Fonction calculant le score d'evaluer à partir des distances et des murs restants des deux joueurs
+        (partagée avec l'évaluation par lots).
+        """
         score_avancer = -poids_avancer * d_moi # score de l'avancé du joueur
         
         score_bloquer = poids_bloquer * d_adversaire # score de l'avancé de l'adversaire
@@ -270,38 +519,18 @@ class GameState:
         importance_murs = poids_murs # poids accordé à l'importance de placer un mur.
         if d_moi <= 4 or d_adversaire <= 4:
             importance_murs = poids_murs * 2 # Changement de la valeur de poids de mur quand la fin de partie approche
-        score_murs = importance_murs * (moi.nb_murs - adversaire.nb_murs)
+        score_murs = importance_murs * (murs_moi - murs_adversaire)
         
         avantage_relatif = d_adversaire - d_moi # Comparaison de l'avancement entre les deux joueurs.
         bonus_avance = poids_avance * avantage_relatif
         
         return score_avancer + score_bloquer + score_murs + bonus_avance
 
-    def bfs(self, plateau: Plateau, start: tuple, target_line: int) -> float:
+    def bfs(self, plateau: PlateauBits, start: tuple, target_line: int) -> float:
         """
         Fonction permettant de retourner la distance entre un joueur et sa ligne d'arrivée. Si pas de chemin trouvé la fonction renvoie la valeur infini
         """
-        visited = {start}
-        q = queue.Queue()
-        q.put((start, 0))
-        dim = len(plateau.matrice)
-
-        while not q.empty():
-            (x, y), dist = q.get()
-            if x == target_line:
-                return dist
-            for dx, dy in [(-2,0),(2,0),(0,-2),(0,2)]:
-                nx, ny = x + dx, y + dy
-                if not (0 <= nx < dim and 0 <= ny < dim):
-                    continue
-                if (nx, ny) in visited:
-                    continue
-                mx, my = (x + nx)//2, (y + ny)//2
-                if plateau.matrice[mx][my] == Plateau.WALL:
-                    continue
-                visited.add((nx, ny))
-                q.put(((nx, ny), dist+1))
-        return math.inf
+        return plateau.distance(start, target_line)
 
     def is_terminal(self) -> bool:
         """
@@ -344,17 +573,36 @@ class GameState:
 
     def minimax(self, profondeur: int, IA_index: int, alpha: float = -math.inf, beta: float = math.inf,
                   poids_avancer=1.2, poids_bloquer=0.8, poids_murs=0.1, 
-                  poids_avance=0.5) -> float:
+                  poids_avance=0.5, contexte: ContexteRecherche = None, ply: int = 0) -> float:
         """
         Fonction min max avec élagage alpha béta. Cette fonction retourne la valeur de l'état de jeux du point de vu du joueur.
-        La fonction est récursive.
+        La fonction est récursive. Si un contexte est donné, les noeuds sont comptés, l'échéance est vérifiée et
+        les coups sont ordonnés par contexte.ordre (ply est la distance à la racine).
         """
-        # On vérifie dans la table de transposition si cet état est déjà connu.
-        state_hash = self.get_hash()
-        if state_hash in TRANSPOSITION_TABLE:
-            stored_depth, stored_value = TRANSPOSITION_TABLE[state_hash]
-            if stored_depth >= profondeur:
+        if contexte is not None:
+            contexte.noeuds += 1
+            contexte.verifier_temps()
+
+        # On vérifie dans la table de transposition si cet état est déjà connu pour ce profil de recherche.
+        # La valeur n'est réutilisée qu'à profondeur égale, et selon sa borne (exacte, inférieure ou supérieure).
+        if contexte is not None:
+            profil = cle_profil(IA_index, poids_avancer, poids_bloquer, poids_murs, poids_avance, self.filtre_murs,
+                                contexte.lmr, contexte.coup_nul)
+        else:
+            profil = cle_profil(IA_index, poids_avancer, poids_bloquer, poids_murs, poids_avance, self.filtre_murs)
+        state_hash = self.get_hash() ^ profil
+        entree = TRANSPOSITION_TABLE.lire(state_hash)
+        if entree is not None and entree[1] == profondeur:
+            _, _, stored_value, borne, _ = entree
+            if borne == LOWER:
+                alpha = max(alpha, stored_value)
+            elif borne == UPPER:
+                beta = min(beta, stored_value)
+            if borne == EXACT or alpha >= beta:
+                if contexte is not None:
+                    contexte.coupures_table += 1
                 return stored_value
+        alpha_initial, beta_initial = alpha, beta
         
         # On vérifie que la partie n'est pas finit
         if self.is_terminal():
@@ -363,61 +611,251 @@ class GameState:
         
         # Condition d'arret de cette fonction récursive.
         if profondeur == 0:
-            return self.evaluer(IA_index, poids_avancer, poids_bloquer, poids_murs, 
-                              poids_avance)
+            if contexte is None:
+                return self.evaluer(IA_index, poids_avancer, poids_bloquer, poids_murs, poids_avance)
+            debut = time.perf_counter()
+            value = self.evaluer(IA_index, poids_avancer, poids_bloquer, poids_murs, poids_avance)
+            contexte.temps_evaluation += time.perf_counter() - debut
+            return value
         
+        if contexte is not None and contexte.coup_nul and ply > 0:
+            score = self._coupure_coup_nul(profondeur, IA_index, alpha, beta,
+                                           (poids_avancer, poids_bloquer, poids_murs, poids_avance), contexte, ply)
+            if score is not None:
+                return score
+
+        # Le meilleur coup connu pour cet état (recherche précédente) est essayé en premier, puis les killers et
+        # l'historique.
+        if contexte is None:
+            coups = self.get_legal_moves()
+        else:
+            debut = time.perf_counter()
+            coups = self.get_legal_moves()
+            contexte.temps_generation += time.perf_counter() - debut
+        coup_table = entree[4] if entree is not None else None
+        if contexte is not None:
+            coups = contexte.ordre.ordonner(coups, ply, self.tour, coup_table)
+        elif coup_table in coups:
+            coups.remove(coup_table)
+            coups.insert(0, coup_table)
+
+        meilleur_coup = None
+        adversaire = self.joueurs[1 - self.tour]
+        pvs = contexte is not None and contexte.pvs
+        lmr = contexte is not None and contexte.lmr and profondeur >= LMR_PROFONDEUR_MIN
+        if (profondeur == 1 and coups and contexte is not None and contexte.evaluation_lot
+                and EvaluationLot.disponible() and adversaire.position[0] != adversaire.ligne_obj):
+            # Dernier niveau : tous les fils sont des feuilles, on les évalue en un seul appel vectorisé.
+            debut = time.perf_counter()
+            scores = EvaluationLot.evaluer_lot(self, coups, IA_index, poids_avancer, poids_bloquer,
+                                               poids_murs, poids_avance)
+            contexte.temps_evaluation += time.perf_counter() - debut
+            contexte.noeuds += len(coups)
+            value = max(scores) if self.tour == IA_index else min(scores)
+            meilleur_coup = coups[scores.index(value)]
+
         # Noeud MAX, c'est à dire le tour du joueur IA. Dans le mode de jeux 3, c'est le tour de l'IA qui appeller cette fonction.
-        if self.tour == IA_index:
+        elif self.tour == IA_index:
             value = -math.inf
-            for move in self.get_legal_moves():
-                nouvel_etat = self.apply_move(move)
-                if nouvel_etat:
-                    score = nouvel_etat.minimax(
-                        profondeur - 1, IA_index, alpha, beta, 
-                        poids_avancer, poids_bloquer, poids_murs,
-                        poids_avance
-                    )
-                    value = max(value, score)
-                    alpha = max(alpha, value)
-                    if alpha >= beta:
-                        break
-            
-            TRANSPOSITION_TABLE[state_hash] = (profondeur, value)
-            return value
+            for rang, move in enumerate(coups):
+                # On joue le coup sur place puis on l'annule après l'appel récursif (pas de copie de l'état).
+                annulation = self.do_move(move)
+                try:
+                    # PVS : après le premier coup, on vérifie d'abord avec une fenêtre nulle que le coup bat alpha,
+                    # il n'est recherché avec la fenêtre complète que dans ce cas. LMR : les murs essayés après les
+                    # premiers coups sont d'abord cherchés un niveau moins profond, et à nouveau à pleine profondeur
+                    # s'ils battent alpha.
+                    reduction = self._reduction_lmr(move, rang) if lmr else 0
+                    complete = True
+                    if reduction or (pvs and rang > 0):
+                        score = self.minimax(
+                            profondeur - 1 - reduction, IA_index, alpha, alpha + FENETRE_NULLE if pvs else beta,
+                            poids_avancer, poids_bloquer, poids_murs,
+                            poids_avance, contexte=contexte, ply=ply + 1
+                        )
+                        complete = score > alpha and (reduction or score < beta)
+                    if complete:
+                        score = self.minimax(
+                            profondeur - 1, IA_index, alpha, beta, 
+                            poids_avancer, poids_bloquer, poids_murs,
+                            poids_avance, contexte=contexte, ply=ply + 1
+                        )
+                finally:
+                    self.undo_move(annulation)
+                if score > value:
+                    value, meilleur_coup = score, move
+                alpha = max(alpha, value)
+                if alpha >= beta:
+                    if contexte is not None:
+                        contexte.ordre.enregistrer_coupure(move, ply, self.tour, profondeur, rang)
+                    break
 
         # Noued MIN tour de l'adversaire.
         else:
             value = math.inf
-            for move in self.get_legal_moves():
-                nouvel_etat = self.apply_move(move)
-                if nouvel_etat:
-                    score = nouvel_etat.minimax(
-                        profondeur - 1, IA_index, alpha, beta, 
-                        poids_avancer, poids_bloquer, poids_murs,
-                        poids_avance
+            for rang, move in enumerate(coups):
+                annulation = self.do_move(move)
+                try:
+                    reduction = self._reduction_lmr(move, rang) if lmr else 0
+                    complete = True
+                    if reduction or (pvs and rang > 0):
+                        score = self.minimax(
+                            profondeur - 1 - reduction, IA_index, beta - FENETRE_NULLE if pvs else alpha, beta,
+                            poids_avancer, poids_bloquer, poids_murs,
+                            poids_avance, contexte=contexte, ply=ply + 1
+                        )
+                        complete = score < beta and (reduction or score > alpha)
+                    if complete:
+                        score = self.minimax(
+                            profondeur - 1, IA_index, alpha, beta, 
+                            poids_avancer, poids_bloquer, poids_murs,
+                            poids_avance, contexte=contexte, ply=ply + 1
+                        )
+                finally:
+                    self.undo_move(annulation)
+                if score < value:
+                    value, meilleur_coup = score, move
+                beta = min(beta, value)
+                if beta <= alpha:
+                    if contexte is not None:
+                        contexte.ordre.enregistrer_coupure(move, ply, self.tour, profondeur, rang)
+                    break
+
+        # La valeur est une borne si elle est sortie de la fenêtre (alpha, beta) reçue.
+        if value <= alpha_initial:
+            borne = UPPER
+        elif value >= beta_initial:
+            borne = LOWER
+        else:
+            borne = EXACT
+        TRANSPOSITION_TABLE.enregistrer(state_hash, profondeur, value, borne, meilleur_coup)
+        return value
+    
+    def _recherche_racine(self, coups_possibles, profondeur, IA_index, poids, contexte=None,
+                          alpha=-math.inf, beta=math.inf) -> tuple:
+        """
+        Fonction évaluant chaque coup de la racine à la profondeur donnée, dans la fenêtre (alpha, beta).
+        Elle retourne le meilleur coup et son score. Avec contexte.pvs, les coups après le premier sont d'abord
+        vérifiés avec une fenêtre nulle.
+        """
+        meilleur_score = float('-inf')
+        meilleur_coup = None
+        pvs = contexte is not None and contexte.pvs
+        
+        # Recherche du meilleur coup en simulant le coup et en evaluant l'état du jeu après ce coup.
+        for rang, coup in enumerate(coups_possibles):
+            annulation = self.do_move(coup)
+            try:
+                complete = True
+                if pvs and rang > 0:
+                    score = -self.minimax(
+                        profondeur-1, 1-IA_index, -alpha - FENETRE_NULLE, -alpha,
+                        *poids, contexte=contexte, ply=1
                     )
-                    value = min(value, score)
-                    beta = min(beta, value)
-                    if beta <= alpha:
-                        break
+                    complete = alpha < score < beta
+                if complete:
+                    score = -self.minimax(
+                        profondeur-1, 1-IA_index, -beta, -alpha,
+                        *poids, contexte=contexte, ply=1
+                    )
+            finally:
+                self.undo_move(annulation)
             
-            TRANSPOSITION_TABLE[state_hash] = (profondeur, value)
-            return value
-    
+            if score > meilleur_score:
+                meilleur_score = score
+                meilleur_coup = coup
+                
+            alpha = max(alpha, score)
+            if alpha >= beta:
+                break
+        return meilleur_coup, meilleur_score
+
+    def _recherche_aspiration(self, coups_possibles, profondeur, IA_index, poids, contexte, centre) -> tuple:
+        """
+        Fonction de recherche de la racine avec une fenêtre d'aspiration : la fenêtre est centrée sur le score de
+        l'itération précédente, et la recherche est refaite avec la fenêtre complète si le score en sort.
+        """
+        alpha, beta = centre - FENETRE_ASPIRATION, centre + FENETRE_ASPIRATION
+        meilleur_coup, score = self._recherche_racine(coups_possibles, profondeur, IA_index, poids, contexte,
+                                                      alpha, beta)
+        if alpha < score < beta:
+            return meilleur_coup, score
+        return self._recherche_racine(coups_possibles, profondeur, IA_index, poids, contexte)
+
     def choix_coup(self, profondeur=3, IA_index=None, epsilon=0.0,
                   poids_avancer=1.2, poids_bloquer=0.8, poids_murs=0.1,
-                  poids_avance=0.5) -> tuple:
+                  poids_avance=0.5, temps_max=None, profondeur_max=32,
+                  contexte: ContexteRecherche = None, evaluation_lot=False, workers=None,
+                  rappel_statistiques=None, rng: random.Random = None, livre=None, cache=None,
+                  finale=True, moteur="minimax", iterations=None, pvs=False, aspiration=False,
+                  lmr=False, coup_nul=False, filtre_murs=True, anticipation=None) -> tuple:
         """
         Fonction permettant de choisir un coup parmi tous les coups possibles.
+        Sans temps_max la recherche se fait à la profondeur fixe `profondeur`. Avec temps_max (en secondes),
+        on approfondit progressivement (1, 2, 3... jusqu'à profondeur_max) et on retourne le meilleur coup de la
+        dernière profondeur terminée avant l'échéance.
+        Un contexte peut être fourni pour récupérer les compteurs de la recherche (noeuds, coupures...) et le score
+        du coup choisi ; contexte.statistiques() les regroupe. rappel_statistiques, s'il est donné, est appelé avec
+        ces statistiques (StatistiquesRecherche) une fois le coup choisi.
+        evaluation_lot active l'évaluation vectorisée (NumPy) des feuilles au dernier niveau.
+        rng (random.Random) sert au choix d'un coup aléatoire (epsilon) ; sans rng, le tirage est déterminé par la
+        position et la graine de l'état. Le module random global n'est jamais utilisé.
+        livre (LivreOuvertures) est consulté avant toute recherche : si la position y est, son coup est joué.
+        cache (CacheRecherche) reçoit les résultats profonds de la recherche, pour les parties et exécutions suivantes.
+        finale active le module de fin de partie (voir Finale) quand plus aucun joueur n'a de murs.
+        moteur choisit la recherche : "minimax" (alpha-bêta) ou "mcts" (voir MCTS). MCTS s'arrête après `iterations`
+        itérations ou à temps_max, profondeur et workers ne servent qu'à minimax.
+        pvs active la principal variation search dans minimax (fenêtre nulle pour les coups après le premier, nouvelle
+        recherche s'il dépasse alpha). aspiration centre la fenêtre de chaque itération (avec temps_max) sur le score
+        de la précédente.
+        lmr réduit d'un niveau la recherche des murs essayés après les premiers coups (nouvelle recherche complète
+        s'ils s'avèrent bons), coup_nul coupe les noeuds où passer son tour suffit déjà (hors risque de zugzwang, et
+        seulement aux noeuds cherchés à fenêtre nulle, donc avec pvs).
+        filtre_murs=False cherche parmi tous les murs légaux au lieu des seuls murs jugés intéressants (l'état est remis
+        dans son mode de génération à la fin).
+        anticipation (dictionnaire clé de Zobrist -> (coup, score), voir Anticipation) contient des recherches déjà
+        faites pendant le tour de l'adversaire : si la position y est, son coup est joué à la place de la recherche.
+        workers > 1 répartit les coups de la racine sur un pool de processus (recherche à profondeur fixe uniquement) ;
+        le coup choisi est le même qu'en séquentiel.
         """
         if IA_index is None:
             IA_index = self.tour
-        
+        if contexte is None:
+            contexte = ContexteRecherche()
+        contexte.evaluation_lot = evaluation_lot
+        contexte.pvs = pvs
+        contexte.lmr = lmr
+        contexte.coup_nul = coup_nul
+        contexte.demarrer(temps_max, TRANSPOSITION_TABLE)
+        if rng is None:
+            rng = random.Random(self.get_hash() ^ self.graine)
+        poids = (poids_avancer, poids_bloquer, poids_murs, poids_avance)
+        if cache is not None:
+            TRANSPOSITION_TABLE.journaliser(cache.profondeur_min)
+        filtre_etat, self.filtre_murs = self.filtre_murs, filtre_murs
+        try:
+            meilleur_coup = self._choisir_coup(profondeur, IA_index, epsilon, poids, temps_max, profondeur_max,
+                                               contexte, workers, rng, livre, finale, moteur, iterations,
+                                               aspiration, anticipation)
+        finally:
+            self.filtre_murs = filtre_etat
+            if cache is not None:
+                # toute la recherche se fait du point de vue de l'adversaire (minimax est appelé avec 1 - IA_index)
+                cache.ajouter(TRANSPOSITION_TABLE.fin_journal(),
+                              cle_profil(1 - IA_index, *poids, filtre_murs, lmr, coup_nul))
+        if rappel_statistiques is not None:
+            rappel_statistiques(contexte.statistiques())
+        return meilleur_coup
+
+    def _choisir_coup(self, profondeur, IA_index, epsilon, poids, temps_max, profondeur_max, contexte,
+                      workers, rng, livre, finale, moteur, iterations, aspiration, anticipation) -> tuple:
+        """
+        Fonction faisant le choix du coup de choix_coup, avec un contexte déjà démarré.
+        """
         # récupération des coups possibles
         coups_possibles = self.get_legal_moves()
         
         if not coups_possibles:
-            print("Aucun coup possible!")
             return None
 
         # Si un seul coup possible on le joue.
@@ -426,40 +864,90 @@ class GameState:
         
         # si l'action est une action de victoire on le joue.
         for coup in coups_possibles:
-            nouvel_etat = self.apply_move(coup)
-            if nouvel_etat and nouvel_etat.is_terminal():
+            annulation = self.do_move(coup)
+            victoire = self.is_terminal()
+            self.undo_move(annulation)
+            if victoire:
                 return coup
         
-        if random.random() < epsilon:
-            return random.choice(coups_possibles)
+        if rng.random() < epsilon:
+            return rng.choice(coups_possibles)
         
-        meilleur_score = float('-inf')
-        meilleur_coup = None
-        alpha = float('-inf')
-        beta = float('inf')
+        # Position connue du livre d'ouvertures : pas de recherche. Le coup n'est joué que s'il fait partie des coups
+        # générés ici (protection contre une collision de clés ou un livre d'une autre variante).
+        if livre is not None:
+            coup = livre.coup(self)
+            if coup is not None and coup in coups_possibles:
+                contexte.coups_livre += 1
+                return coup
         
-        # Recherche du meilleur coup en simulant le coup et en evaluant l'état du jeu après ce coup.
-        for coup in coups_possibles:
-            nouvel_etat = self.apply_move(coup)
-            if nouvel_etat is None:
-                continue
-                
-            score = -nouvel_etat.minimax(
-                profondeur-1, 1-IA_index, -beta, -alpha,
-                poids_avancer, poids_bloquer, poids_murs,
-                poids_avance
-            )
-            
-            if score > meilleur_score:
-                meilleur_score = score
-                meilleur_coup = coup
-                
-            alpha = max(alpha, score)
-            if alpha >= beta:
-                break
+        # Fin de partie : course résolue exactement quand plus personne n'a de murs, recherche spécialisée quand un
+        # seul joueur en a encore.
+        if finale:
+            coup = coup_finale(self, coups_possibles)
+            if coup is not None and coup in coups_possibles:
+                contexte.coups_finale += 1
+                return coup
+        
+        # Position déjà cherchée pendant le tour de l'adversaire (mêmes paramètres, sans le tirage epsilon fait plus
+        # haut)
+        if anticipation is not None:
+            resultat = anticipation.get(self.get_hash())
+            if resultat is not None and resultat[0] in coups_possibles:
+                contexte.coups_anticipes += 1
+                meilleur_coup, contexte.score = resultat
+                return meilleur_coup
+        
+        if moteur == "mcts":
+            meilleur_coup, contexte.score = recherche_mcts(self, coups_possibles, poids, contexte, rng, iterations)
+            return meilleur_coup if meilleur_coup is not None else coups_possibles[0]
+        if moteur != "minimax":
+            raise ValueError(f"Moteur inconnu: {moteur}")
+        
+        if temps_max is None:
+            coups_possibles = contexte.ordre.ordonner(coups_possibles, 0, self.tour)
+            if workers is not None and workers > 1:
+                meilleur_coup, contexte.score = recherche_racine_parallele(self, coups_possibles, profondeur,
+                                                                           IA_index, poids, workers, contexte)
+            else:
+                meilleur_coup, contexte.score = self._recherche_racine(coups_possibles, profondeur, IA_index, poids,
+                                                                       contexte)
+            contexte.profondeur_atteinte = profondeur
+            contexte.profondeurs[profondeur] = [time.perf_counter() - contexte.debut, contexte.noeuds]
+        else:
+            meilleur_coup = None
+            for p in range(1, profondeur_max + 1):
+                # Le meilleur coup de l'itération précédente est cherché en premier ; dans l'arbre, la table de
+                # transposition fournit le meilleur coup de chaque noeud de la ligne principale précédente.
+                coups_possibles = contexte.ordre.ordonner(coups_possibles, 0, self.tour, meilleur_coup)
+                # la profondeur 1 est toujours terminée, pour avoir au moins un coup à jouer
+                echeance, contexte.echeance = contexte.echeance, (contexte.echeance if p > 1 else None)
+                debut, noeuds = time.perf_counter(), contexte.noeuds
+                try:
+                    if aspiration and p > 1:
+                        meilleur_coup, contexte.score = self._recherche_aspiration(coups_possibles, p, IA_index,
+                                                                                   poids, contexte, contexte.score)
+                    else:
+                        meilleur_coup, contexte.score = self._recherche_racine(coups_possibles, p, IA_index, poids,
+                                                                               contexte)
+                except TempsEcoule:
+                    break
+                finally:
+                    contexte.echeance = echeance
+                contexte.profondeur_atteinte = p
+                contexte.profondeurs[p] = [time.perf_counter() - debut, contexte.noeuds - noeuds]
+                if contexte.echeance is not None and time.perf_counter() >= contexte.echeance:
+                    break
+
         # Condition si aucun meilleur coup n'est trouvé.
         if meilleur_coup is None and coups_possibles:
             meilleur_coup = coups_possibles[0]
             
         return meilleur_coup
 
+
+def _restaurer_etat(compact: EtatCompact, graine: int, filtre_murs: bool) -> GameState:
+    """
+    Fonction de désérialisation d'un GameState (voir GameState.__reduce__).
+    """
+    return GameState.depuis_compact(compact, graine, filtre_murs)
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+# LivreOuvertures.py
+# Livre d'ouvertures : meilleurs coups précalculés (recherche profonde) pour les positions des premiers coups de la
+# partie, stockés dans un fichier d'entrées de taille fixe triées par clé de Zobrist et lu par mmap.
+#
+#   python LivreOuvertures.py livre.bin --coups 6 --profondeur 4 --largeur 3
+
+import argparse
+import math
+import mmap
+import os
+import struct
+from functools import lru_cache
+from GameState import TRANSPOSITION_TABLE
+from Recherche import ContexteRecherche
+
+MAGIQUE = b"QLIV"
+VERSION = 1
+# en-tête : magique, version, taille du plateau, nombre d'entrées (16 octets)
+ENTETE = struct.Struct("<4sHHI4x")
+# entrée : clé de Zobrist, type de coup (0 déplacement, 1 mur horizontal, 2 mur vertical), x, y, profondeur de la
+# recherche, score (16 octets)
+ENTREE = struct.Struct("<QBBBBf")
+CLE = struct.Struct("<Q")
+
+TYPES_COUPS = {"move": 0, "h": 1, "v": 2}
+
+
+def encoder_coup(coup: tuple) -> tuple:
+    """
+    Fonction convertissant un coup en (type, x, y) pour l'écrire dans une entrée.
+    """
+    if coup[0] == "move":
+        return (0,) + tuple(coup[1])
+    _, x, y, orientation = coup
+    return TYPES_COUPS[orientation], x, y
+
+
+def decoder_coup(type_coup: int, x: int, y: int) -> tuple:
+    """
+    Fonction inverse de encoder_coup.
+    """
+    if type_coup == 0:
+        return ("move", (x, y))
+    return ("wall", x, y, "h" if type_coup == 1 else "v")
+
+
+class LivreOuvertures:
+    """
+    Classe donnant accès à un livre d'ouvertures. Le fichier est projeté en mémoire (mmap) : l'ouverture ne lit que
+    l'en-tête, une recherche est une dichotomie sur les entrées triées, et plusieurs processus qui ouvrent le même
+    fichier partagent les mêmes pages en mémoire.
+    """
+    def __init__(self, chemin: str):
+        """
+        Fonction d'initialisation de la classe : ouverture et vérification du fichier.
+        """
+        with open(chemin, "rb") as f:
+            self._donnees = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magique, version, self.taille, self.nb_entrees = ENTETE.unpack_from(self._donnees, 0)
+        if magique != MAGIQUE or version != VERSION:
+            raise ValueError(f"{chemin} n'est pas un livre d'ouvertures (version {VERSION})")
+        if len(self._donnees) != ENTETE.size + self.nb_entrees * ENTREE.size:
+            raise ValueError(f"{chemin} est tronqué")
+
+    def __len__(self):
+        return self.nb_entrees
+
+    def chercher(self, cle: int):
+        """
+        Fonction retournant (coup, profondeur, score) pour la clé de Zobrist donnée, None si elle n'est pas dans le
+        livre.
+        """
+        bas, haut = 0, self.nb_entrees
+        while bas < haut:
+            milieu = (bas + haut) // 2
+            cle_milieu, = CLE.unpack_from(self._donnees, ENTETE.size + milieu * ENTREE.size)
+            if cle_milieu < cle:
+                bas = milieu + 1
+            else:
+                haut = milieu
+        if bas == self.nb_entrees:
+            return None
+        cle_trouvee, type_coup, x, y, profondeur, score = ENTREE.unpack_from(self._donnees,
+                                                                            ENTETE.size + bas * ENTREE.size)
+        if cle_trouvee != cle:
+            return None
+        return decoder_coup(type_coup, x, y), profondeur, score
+
+    def coup(self, etat):
+        """
+        Fonction retournant le coup du livre pour un état du jeu (GameState), None si la position n'y est pas.
+        """
+        if etat.plateau.taille != self.taille:
+            return None
+        entree = self.chercher(etat.get_hash())
+        return None if entree is None else entree[0]
+
+    def fermer(self):
+        """
+        Fonction fermant la projection du fichier.
+        """
+        self._donnees.close()
+
+    @staticmethod
+    def ecrire(chemin: str, taille: int, entrees: dict):
+        """
+        Fonction écrivant un livre : entrees associe une clé de Zobrist à (coup, profondeur, score).
+        Le fichier est écrit à côté puis renommé, un livre ouvert par d'autres processus n'est donc jamais vu à moitié
+        écrit.
+        """
+        temporaire = chemin + ".tmp"
+        with open(temporaire, "wb") as f:
+            f.write(ENTETE.pack(MAGIQUE, VERSION, taille, len(entrees)))
+            for cle in sorted(entrees):
+                coup, profondeur, score = entrees[cle]
+                f.write(ENTREE.pack(cle, *encoder_coup(coup), profondeur, score))
+        os.replace(temporaire, chemin)
+
+
+@lru_cache(maxsize=None)
+def ouvrir_livre(chemin):
+    """
+    Fonction retournant le livre d'ouvertures d'un fichier, ouvert une seule fois par processus (None si chemin vaut
+    None). C'est la forme attendue par choix_coup pour la clé "livre" d'un niveau d'IA.
+    """
+    return None if chemin is None else LivreOuvertures(chemin)
+
+
+def _scores_racine(etat, profondeur, poids) -> list:
+    """
+    Fonction retournant le score exact (fenêtre complète) de chaque coup de l'état, du meilleur au moins bon.
+    À score égal, l'ordre de génération des coups est conservé.
+    """
+    IA_index = etat.tour
+    contexte = ContexteRecherche()
+    scores = []
+    for coup in etat.get_legal_moves():
+        annulation = etat.do_move(coup)
+        try:
+            score = -etat.minimax(profondeur - 1, 1 - IA_index, -math.inf, math.inf, *poids,
+                                  contexte=contexte, ply=1)
+        finally:
+            etat.undo_move(annulation)
+        scores.append((score, coup))
+    scores.sort(key=lambda s: -s[0])
+    return scores
+
+
+def generer_livre(chemin, etat, nb_coups=6, profondeur=4, largeur=3, poids=(1.5, 1, 0.4, 0.7), rappel=None) -> int:
+    """
+    Fonction construisant un livre d'ouvertures pour les positions des nb_coups premiers coups depuis `etat`
+    (la position de départ d'une partie).
+    Chaque position est cherchée à `profondeur` avec les poids donnés et son meilleur coup est enregistré ; on
+    continue ensuite depuis ses `largeur` meilleurs coups (ceux qu'un adversaire a le plus de chances de jouer).
+    rappel(ply, nb_positions) est appelé à la fin de chaque ply. Retourne le nombre d'entrées écrites.
+    """
+    TRANSPOSITION_TABLE.clear()
+    entrees = {}
+    niveau = [etat]
+    for ply in range(nb_coups):
+        suivant = []
+        for position in niveau:
+            cle = position.get_hash()
+            if cle in entrees or position.get_winner() is not None:
+                continue
+            scores = _scores_racine(position, profondeur, poids)
+            if not scores:
+                continue
+            meilleur_score, meilleur_coup = scores[0]
+            entrees[cle] = (meilleur_coup, profondeur, meilleur_score)
+            suivant.extend(position.apply_move(coup) for _, coup in scores[:largeur])
+        niveau = suivant
+        if rappel is not None:
+            rappel(ply + 1, len(entrees))
+    LivreOuvertures.ecrire(chemin, etat.plateau.taille, entrees)
+    return len(entrees)
+
+
+if __name__ == "__main__":
+    from PartieAuto import etat_initial
+    
+    parser = argparse.ArgumentParser(description="Génération d'un livre d'ouvertures")
+    parser.add_argument("fichier", help="fichier du livre à écrire")
+    parser.add_argument("--coups", type=int, default=6, help="nombre de coups (plies) couverts")
+    parser.add_argument("--profondeur", type=int, default=4, help="profondeur de recherche de chaque position")
+    parser.add_argument("--largeur", type=int, default=3, help="nombre de meilleurs coups suivis par position")
+    parser.add_argument("--poids", type=float, nargs=4, default=(1.5, 1, 0.4, 0.7),
+                        metavar=("AVANCER", "BLOQUER", "MURS", "AVANCE"), help="poids de l'évaluation")
+    parser.add_argument("--taille", type=int, default=9, help="taille du plateau")
+    parser.add_argument("--murs", type=int, default=None, help="murs par joueur (défaut : taille + 1)")
+    args = parser.parse_args()
+    nb = generer_livre(args.fichier, etat_initial(args.taille, nb_murs=args.murs), args.coups, args.profondeur,
+                       args.largeur, tuple(args.poids),
+                       rappel=lambda ply, nb: print(f"ply {ply}: {nb} positions"))
+    print(f"{nb} positions écrites dans {args.fichier}")
@@ -0,0 +1,156 @@
+import math
+import time
+
+# Constante d'exploration de UCT (compromis entre les coups prometteurs et les coups peu essayés)
+EXPLORATION = 1.4
+# Nombre maximal de coups d'une simulation, la position atteinte est ensuite évaluée
+LONGUEUR_SIMULATION = 12
+# Probabilité qu'un coup de simulation avance le pion sur un plus court chemin (sinon coup légal au hasard)
+PROBA_CHEMIN = 0.8
+# Échelle de la sigmoïde qui convertit le score d'evaluer en probabilité de victoire
+ECHELLE_EVALUATION = 3.0
+# Nombre d'itérations quand aucun budget (itérations ou temps) n'est donné
+ITERATIONS_PAR_DEFAUT = 1000
+
+
+class NoeudMCTS:
+    """
+    Classe représentant un noeud de l'arbre de MCTS : le coup qui y mène, le joueur qui l'a joué, les statistiques
+    des simulations passées par ce noeud et les coups pas encore développés.
+    """
+    def __init__(self, coup=None, parent=None, joueur=None):
+        """
+        Fonction d'initialisation de la classe. coups_restants vaut None tant que les coups n'ont pas été générés.
+        """
+        self.coup = coup
+        self.parent = parent
+        self.joueur = joueur  # index du joueur qui a joué coup
+        self.enfants = []
+        self.coups_restants = None
+        self.visites = 0
+        self.gains = 0.0  # somme des récompenses (probabilité de victoire) du joueur qui a joué coup
+
+    def enfant_uct(self, exploration: float) -> "NoeudMCTS":
+        """
+        Fonction retournant l'enfant qui maximise la borne UCT (taux de gain + bonus d'exploration).
+        """
+        log_visites = math.log(self.visites)
+        return max(self.enfants, key=lambda e: e.gains / e.visites + exploration * math.sqrt(log_visites / e.visites))
+
+    def profondeur(self) -> int:
+        """
+        Fonction retournant la profondeur maximale du sous-arbre.
+        """
+        return max((1 + e.profondeur() for e in self.enfants), default=0)
+
+
+def _deplacement_chemin(etat):
+    """
+    Fonction retournant le déplacement du joueur qui a le trait qui le rapproche le plus de sa ligne d'arrivée
+    (lecture dans son champ de distances), None s'il ne peut pas bouger.
+    """
+    joueur = etat.joueurs[etat.tour]
+    x0, y0 = joueur.position
+    champ = etat.champs_distances()[etat.tour]
+    plateau = etat.plateau
+    deplacements = etat._get_legal_moves_deplacement(joueur, x0, y0, plateau.dim)
+    return min(deplacements, key=lambda coup: champ[plateau.indice(*coup[1])], default=None)
+
+
+def _recompense(etat, poids) -> float:
+    """
+    Fonction retournant la probabilité de victoire du joueur 0 dans l'état : 1 ou 0 si la partie est finie,
+    sinon une sigmoïde du score d'evaluer.
+    """
+    gagnant = etat.get_winner()
+    if gagnant is not None:
+        return 1.0 if gagnant == etat.joueurs[0].nom else 0.0
+    score = etat.evaluer(0, *poids)
+    return 1 / (1 + math.exp(-score / ECHELLE_EVALUATION))
+
+
+def _simulation(etat, poids, rng, contexte) -> float:
+    """
+    Fonction jouant une partie rapide depuis l'état (au plus LONGUEUR_SIMULATION coups) et retournant la
+    probabilité de victoire du joueur 0 à la fin. Les coups suivent le plus court chemin avec la probabilité
+    PROBA_CHEMIN, sinon ils sont tirés parmi get_legal_moves. L'état est remis tel quel à la fin.
+    """
+    annulations = []
+    try:
+        for _ in range(LONGUEUR_SIMULATION):
+            if etat.get_winner() is not None:
+                break
+            coup = _deplacement_chemin(etat) if rng.random() < PROBA_CHEMIN else None
+            if coup is None:
+                debut = time.perf_counter()
+                coups = etat.get_legal_moves()
+                contexte.temps_generation += time.perf_counter() - debut
+                if not coups:
+                    break
+                coup = rng.choice(coups)
+            annulations.append(etat.do_move(coup))
+        debut = time.perf_counter()
+        recompense = _recompense(etat, poids)
+        contexte.temps_evaluation += time.perf_counter() - debut
+        return recompense
+    finally:
+        for annulation in reversed(annulations):
+            etat.undo_move(annulation)
+
+
+def recherche_mcts(etat, coups_possibles: list, poids: tuple, contexte, rng, iterations=None,
+                   exploration=EXPLORATION) -> tuple:
+    """
+    Fonction cherchant le coup du joueur qui a le trait par MCTS (UCT) : sélection par la borne UCT, développement
+    d'un coup, simulation guidée par les plus courts chemins, rétropropagation.
+    La recherche est interruptible : elle s'arrête après `iterations` itérations ou à l'échéance du contexte
+    (ITERATIONS_PAR_DEFAUT si aucun des deux n'est donné), vérifiée à chaque itération, et retourne le coup le plus
+    visité jusque-là (le premier coup si l'échéance est passée avant la première itération).
+    Retourne (meilleur coup, taux de gain estimé de ce coup, None si aucune itération).
+    """
+    if iterations is None and contexte.echeance is None:
+        iterations = ITERATIONS_PAR_DEFAUT
+    racine = NoeudMCTS(joueur=1 - etat.tour)
+    # les coups sont développés dans l'ordre de get_legal_moves (déplacements d'abord) : on les dépile par la fin
+    racine.coups_restants = coups_possibles[::-1]
+    n = 0
+    while iterations is None or n < iterations:
+        if contexte.echeance is not None and time.perf_counter() >= contexte.echeance:
+            break
+        n += 1
+        noeud = racine
+        annulations = []
+        try:
+            # sélection
+            while not noeud.coups_restants and noeud.enfants:
+                noeud = noeud.enfant_uct(exploration)
+                annulations.append(etat.do_move(noeud.coup))
+            # développement
+            if etat.get_winner() is None:
+                if noeud.coups_restants is None:
+                    debut = time.perf_counter()
+                    noeud.coups_restants = etat.get_legal_moves()[::-1]
+                    contexte.temps_generation += time.perf_counter() - debut
+                if noeud.coups_restants:
+                    coup = noeud.coups_restants.pop()
+                    enfant = NoeudMCTS(coup, noeud, etat.tour)
+                    noeud.enfants.append(enfant)
+                    noeud = enfant
+                    annulations.append(etat.do_move(coup))
+                    contexte.noeuds += 1
+            # simulation
+            recompense = _simulation(etat, poids, rng, contexte)
+        finally:
+            for annulation in reversed(annulations):
+                etat.undo_move(annulation)
+        # rétropropagation
+        while noeud is not None:
+            noeud.visites += 1
+            noeud.gains += recompense if noeud.joueur == 0 else 1 - recompense
+            noeud = noeud.parent
+
+    contexte.profondeur_atteinte = racine.profondeur()
+    if not racine.enfants:
+        return (coups_possibles[0] if coups_possibles else None), None
+    meilleur = max(racine.enfants, key=lambda e: (e.visites, e.gains))
+    return meilleur.coup, meilleur.gains / meilleur.visites
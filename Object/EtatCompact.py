@@ -0,0 +1,99 @@
+# EtatCompact.py
+from functools import lru_cache
+
+# Nombre de bits réservés au nombre de murs restants de chaque joueur
+BITS_NB_MURS = 10
+# Nombre de bits réservés à la taille du plateau
+BITS_TAILLE = 5
+
+
+@lru_cache(maxsize=None)
+def _format(taille: int) -> tuple:
+    """
+    Fonction retournant le découpage de la clé pour une taille de plateau : (bits d'une case, bits d'un masque
+    de murs). De bas en haut la clé contient la taille, le trait, les murs restants des deux joueurs, les cases des
+    deux pions, puis les murs horizontaux et verticaux.
+    """
+    return (taille * taille - 1).bit_length(), (taille - 1) * (taille - 1)
+
+
+class EtatCompact:
+    """
+    Classe représentant une position de jeu par un seul entier (murs posés, cases des pions, murs restants, trait et
+    taille du plateau). Elle est immuable, hachable et comparable sur cette clé, et se sérialise en un entier :
+    c'est la forme à utiliser pour les ensembles et dictionnaires de positions et pour les envois entre processus.
+    Les joueurs sont ceux d'une partie normale : "1" vise la dernière ligne, "2" la première.
+    """
+    __slots__ = ("cle",)
+
+    def __init__(self, cle: int):
+        """
+        Fonction d'initialisation de la classe à partir d'une clé déjà construite (voir depuis).
+        """
+        object.__setattr__(self, "cle", cle)
+
+    def __setattr__(self, nom, valeur):
+        raise AttributeError("EtatCompact est immuable")
+
+    @classmethod
+    def depuis(cls, taille: int, murs_h: int, murs_v: int, cases: tuple, nb_murs: tuple, tour: int) -> "EtatCompact":
+        """
+        Fonction construisant l'état compact à partir de ses composantes (cases : indices de PlateauBits).
+        """
+        bits_case, bits_murs = _format(taille)
+        cle = murs_v
+        cle = (cle << bits_murs) | murs_h
+        for case in reversed(cases):
+            cle = (cle << bits_case) | case
+        for nb in reversed(nb_murs):
+            cle = (cle << BITS_NB_MURS) | nb
+        cle = (cle << 1) | tour
+        cle = (cle << BITS_TAILLE) | taille
+        return cls(cle)
+
+    def composantes(self) -> tuple:
+        """
+        Fonction retournant (taille, murs_h, murs_v, cases, nb_murs, tour), l'inverse de depuis.
+        """
+        cle = self.cle
+        taille = cle & ((1 << BITS_TAILLE) - 1)
+        cle >>= BITS_TAILLE
+        bits_case, bits_murs = _format(taille)
+        tour = cle & 1
+        cle >>= 1
+        nb_murs = []
+        for _ in range(2):
+            nb_murs.append(cle & ((1 << BITS_NB_MURS) - 1))
+            cle >>= BITS_NB_MURS
+        cases = []
+        for _ in range(2):
+            cases.append(cle & ((1 << bits_case) - 1))
+            cle >>= bits_case
+        murs_h = cle & ((1 << bits_murs) - 1)
+        murs_v = cle >> bits_murs
+        return taille, murs_h, murs_v, tuple(cases), tuple(nb_murs), tour
+
+    @property
+    def taille(self) -> int:
+        return self.cle & ((1 << BITS_TAILLE) - 1)
+
+    @property
+    def tour(self) -> int:
+        return self.cle >> BITS_TAILLE & 1
+
+    def __eq__(self, autre):
+        if not isinstance(autre, EtatCompact):
+            return NotImplemented
+        return self.cle == autre.cle
+
+    def __hash__(self):
+        return hash(self.cle)
+
+    def __reduce__(self):
+        # sérialisation : un seul entier
+        return EtatCompact, (self.cle,)
+
+    def __repr__(self):
+        taille, murs_h, murs_v, cases, nb_murs, tour = self.composantes()
+        return (f"EtatCompact(taille={taille}, pions={cases}, murs_restants={nb_murs}, tour={tour}, "
+                f"murs_h={murs_h:#x}, murs_v={murs_v:#x})")
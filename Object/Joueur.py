@@ -1,4 +1,6 @@
 class Joueur:
+    __slots__ = ("nom", "position", "ligne_obj", "nb_murs")
+
     def __init__(self, nom, position, ligne_obj, nb_murs=10):
         self.nom = nom                 # "1" ou "2"
         self.position = position       # tuple (x,y)
@@ -0,0 +1,511 @@
+# PlateauBits.py
+import math
+from heapq import heappush, heappop
+from collections import deque
+from Object.Plateau import Plateau
+
+
+class _Geometrie:
+    """
+    Masques pré-calculés pour une taille de plateau donnée (partagés par tous les plateaux de même taille).
+    """
+    __slots__ = ("n", "nb_cases", "nb_emplacements", "lignes", "bord_bas", "bord_droite", "appuis_h", "appuis_v",
+                 "passages_h", "passages_v", "conflits_h", "conflits_v")
+
+    def __init__(self, taille):
+        n = taille
+        self.n = n
+        self.nb_cases = n * n
+        self.nb_emplacements = (n - 1) * (n - 1)
+        # masque de chaque ligne de cases, utilisé pour tester l'arrivée sur la ligne objectif
+        self.lignes = [((1 << n) - 1) << (r * n) for r in range(n)]
+        # bords du plateau : on ne peut ni descendre depuis la dernière ligne, ni aller à droite depuis la dernière
+        # colonne
+        self.bord_bas = self.lignes[n - 1]
+        self.bord_droite = 0
+        for r in range(n):
+            self.bord_droite |= 1 << (r * n + n - 1)
+
+        # Points d'appui des murs. Un mur relie trois coins de la grille (ses deux extrémités et son centre) ;
+        # le coin (R, C), 0 <= R, C <= n, est le point de coordonnées (2R-1, 2C-1) de la matrice.
+        # Pour chaque coin : les murs h et v qui passent par lui (masques d'emplacements).
+        n1 = n - 1
+        par_coin = {}
+        for s in range(self.nb_emplacements):
+            r, c = divmod(s, n1)
+            for coin in ((r + 1, c), (r + 1, c + 1), (r + 1, c + 2)):
+                par_coin.setdefault(coin, [0, 0])[0] |= 1 << s
+            for coin in ((r, c + 1), (r + 1, c + 1), (r + 2, c + 1)):
+                par_coin.setdefault(coin, [0, 0])[1] |= 1 << s
+
+        def appuis(coins):
+            return tuple((R in (0, n) or C in (0, n),) + tuple(par_coin.get((R, C), (0, 0))) for R, C in coins)
+
+        # pour chaque emplacement : les trois coins du mur h (resp. v) sous la forme (sur le bord, murs h, murs v)
+        self.appuis_h = []
+        self.appuis_v = []
+        # passages fermés par le mur : bits de bloque_bas (mur h) ou de bloque_droite (mur v)
+        self.passages_h = []
+        self.passages_v = []
+        for s in range(self.nb_emplacements):
+            r, c = divmod(s, n1)
+            self.appuis_h.append(appuis(((r + 1, c), (r + 1, c + 1), (r + 1, c + 2))))
+            self.appuis_v.append(appuis(((r, c + 1), (r + 1, c + 1), (r + 2, c + 1))))
+            self.passages_h.append(0b11 << (r * n + c))
+            self.passages_v.append((1 << (r * n + c)) | (1 << ((r + 1) * n + c)))
+
+        # Murs en conflit avec un mur posé en s, sur l'occupation combinée murs_h | murs_v << nb_emplacements :
+        # un mur h chevauche les murs h de la même ligne en s - 1, s, s + 1 et croise le mur v de même centre ;
+        # un mur v chevauche les murs v de la même colonne en s - (n - 1), s, s + (n - 1) et croise le mur h en s.
+        # Un mur est posable si et seulement si (occupation & conflits) == 0.
+        e = self.nb_emplacements
+        self.conflits_h = []
+        self.conflits_v = []
+        for s in range(e):
+            r, c = divmod(s, n1)
+            h = 1 << s
+            if c > 0:
+                h |= 1 << (s - 1)
+            if c < n1 - 1:
+                h |= 1 << (s + 1)
+            self.conflits_h.append(h | (1 << s) << e)
+            v = 1 << s
+            if r > 0:
+                v |= 1 << (s - n1)
+            if r < n1 - 1:
+                v |= 1 << (s + n1)
+            self.conflits_v.append((1 << s) | v << e)
+
+
+_GEOMETRIES = {}
+
+
+def _geometrie(taille):
+    """
+    Fonction retournant (et mettant en cache) la géométrie associée à une taille de plateau.
+    """
+    geo = _GEOMETRIES.get(taille)
+    if geo is None:
+        geo = _GEOMETRIES[taille] = _Geometrie(taille)
+    return geo
+
+
+class PlateauBits:
+    """
+    Plateau compact utilisé par le moteur de recherche.
+    Les murs horizontaux et verticaux sont deux entiers (un bit par emplacement de mur) et les pions sont
+    repérés par l'indice de leur case. Les coordonnées publiques restent celles de la matrice de Plateau
+    (cases sur les indices pairs, murs centrés sur les indices impairs).
+    """
+    __slots__ = ("taille", "dim", "_geo", "murs_h", "murs_v", "bloque_bas", "bloque_droite", "pions")
+
+    def __init__(self, taille=9):
+        self.taille = taille
+        self.dim = 2 * taille - 1
+        self._geo = _geometrie(taille)
+        # un bit par emplacement (r, c), indice r * (taille - 1) + c, centré en (2r+1, 2c+1) dans la matrice
+        self.murs_h = 0
+        self.murs_v = 0
+        # un bit par case : passage vers le bas / vers la droite fermé (bords du plateau inclus)
+        self.bloque_bas = self._geo.bord_bas
+        self.bloque_droite = self._geo.bord_droite
+        # nom du joueur -> indice de sa case
+        self.pions = {}
+
+    @classmethod
+    def depuis_plateau(cls, plateau: Plateau, joueurs=()) -> "PlateauBits":
+        """
+        Fonction permettant de construire un plateau compact à partir d'un Plateau classique.
+        """
+        nouveau = cls(plateau.taille)
+        m = plateau.matrice
+        dim = nouveau.dim
+        # Les segments (impair, pair) n'appartiennent qu'aux murs horizontaux et les segments (pair, impair)
+        # qu'aux murs verticaux. Chaque mur couvre deux segments consécutifs : on les attribue de gauche à droite.
+        for x in range(1, dim, 2):
+            y = 0
+            while y < dim - 2:
+                if m[x][y] == Plateau.WALL and m[x][y + 1] == Plateau.WALL and m[x][y + 2] == Plateau.WALL:
+                    nouveau._poser_h((x - 1) // 2, y // 2)
+                    y += 4
+                else:
+                    y += 2
+        for y in range(1, dim, 2):
+            x = 0
+            while x < dim - 2:
+                if m[x][y] == Plateau.WALL and m[x + 1][y] == Plateau.WALL and m[x + 2][y] == Plateau.WALL:
+                    nouveau._poser_v(x // 2, (y - 1) // 2)
+                    x += 4
+                else:
+                    x += 2
+        for j in joueurs:
+            nouveau.placer_joueur(j)
+        return nouveau
+
+    @classmethod
+    def depuis_murs(cls, taille: int, murs_h: int, murs_v: int) -> "PlateauBits":
+        """
+        Fonction construisant un plateau compact (sans pions) à partir des masques de murs horizontaux et verticaux.
+        """
+        nouveau = cls(taille)
+        geo = nouveau._geo
+        nouveau.murs_h, nouveau.murs_v = murs_h, murs_v
+        for masque, passages, attribut in ((murs_h, geo.passages_h, "bloque_bas"),
+                                           (murs_v, geo.passages_v, "bloque_droite")):
+            bloque = getattr(nouveau, attribut)
+            while masque:
+                bit = masque & -masque
+                bloque |= passages[bit.bit_length() - 1]
+                masque ^= bit
+            setattr(nouveau, attribut, bloque)
+        return nouveau
+
+    def vers_plateau(self) -> Plateau:
+        """
+        Fonction permettant de reconstruire un Plateau classique (matrice de caractères) pour l'affichage et le jeu
+        humain.
+        """
+        plateau = Plateau(self.taille)
+        m = plateau.matrice
+        n1 = self.taille - 1
+        for s in range(self._geo.nb_emplacements):
+            x, y = 2 * (s // n1) + 1, 2 * (s % n1) + 1
+            if self.murs_h >> s & 1:
+                for dy in (-1, 0, 1):
+                    m[x][y + dy] = Plateau.WALL
+            if self.murs_v >> s & 1:
+                for dx in (-1, 0, 1):
+                    m[x + dx][y] = Plateau.WALL
+        for nom, i in self.pions.items():
+            x, y = self.coordonnees(i)
+            m[x][y] = nom
+        return plateau
+
+    def copie(self) -> "PlateauBits":
+        """
+        Fonction permettant de copier le plateau (quelques entiers et un petit dictionnaire).
+        """
+        nouveau = PlateauBits.__new__(PlateauBits)
+        nouveau.taille = self.taille
+        nouveau.dim = self.dim
+        nouveau._geo = self._geo
+        nouveau.murs_h = self.murs_h
+        nouveau.murs_v = self.murs_v
+        nouveau.bloque_bas = self.bloque_bas
+        nouveau.bloque_droite = self.bloque_droite
+        nouveau.pions = dict(self.pions)
+        return nouveau
+
+    def afficher(self):
+        self.vers_plateau().afficher()
+
+    def indice(self, x, y) -> int:
+        """
+        Fonction convertissant des coordonnées de matrice (paires) en indice de case.
+        """
+        return (x >> 1) * self.taille + (y >> 1)
+
+    def coordonnees(self, i) -> tuple:
+        """
+        Fonction convertissant un indice de case en coordonnées de matrice.
+        """
+        return (2 * (i // self.taille), 2 * (i % self.taille))
+
+    def placer_joueur(self, joueur):
+        self.pions[joueur.nom] = self.indice(*joueur.position)
+
+    def deplacer_pion(self, nom, position):
+        self.pions[nom] = self.indice(*position)
+
+    def emplacement(self, x, y) -> int:
+        # indice de l'emplacement de mur centré en (x, y), coordonnées impaires
+        return (x >> 1) * (self.taille - 1) + (y >> 1)
+
+    def occupation(self) -> int:
+        """
+        Fonction retournant les murs posés sous forme d'un seul masque (murs_h | murs_v << nb_emplacements), à
+        comparer aux masques de conflit de la géométrie.
+        """
+        return self.murs_h | self.murs_v << self._geo.nb_emplacements
+
+    def est_mur_horizontal_valide(self, x, y):
+        if x % 2 == 0 or y % 2 == 0 or not (0 < x < self.dim - 1 and 0 < y < self.dim - 1):
+            return False
+        # chevauchement avec un mur horizontal voisin ou croisement avec un mur vertical au même centre
+        return not self.occupation() & self._geo.conflits_h[self.emplacement(x, y)]
+
+    def est_mur_vertical_valide(self, x, y):
+        if x % 2 == 0 or y % 2 == 0 or not (0 < x < self.dim - 1 and 0 < y < self.dim - 1):
+            return False
+        return not self.occupation() & self._geo.conflits_v[self.emplacement(x, y)]
+
+    def murs_libres(self) -> list:
+        """
+        Fonction retournant tous les murs qui peuvent être posés sans chevaucher ni croiser un mur existant,
+        (x, y, orientation), par emplacement puis h avant v. La fermeture des chemins n'est pas vérifiée ici.
+        """
+        geo = self._geo
+        occupation = self.occupation()
+        n1 = self.taille - 1
+        murs = []
+        for s in range(geo.nb_emplacements):
+            x, y = 2 * (s // n1) + 1, 2 * (s % n1) + 1
+            if not occupation & geo.conflits_h[s]:
+                murs.append((x, y, "h"))
+            if not occupation & geo.conflits_v[s]:
+                murs.append((x, y, "v"))
+        return murs
+
+    def _poser_h(self, r, c):
+        n = self.taille
+        self.murs_h |= 1 << (r * (n - 1) + c)
+        self.bloque_bas |= 0b11 << (r * n + c)
+
+    def _poser_v(self, r, c):
+        n = self.taille
+        self.murs_v |= 1 << (r * (n - 1) + c)
+        self.bloque_droite |= (1 << (r * n + c)) | (1 << ((r + 1) * n + c))
+
+    def placer_mur(self, x, y, orientation):
+        if orientation == "h" and self.est_mur_horizontal_valide(x, y):
+            self._poser_h(x >> 1, y >> 1)
+            return True
+        if orientation == "v" and self.est_mur_vertical_valide(x, y):
+            self._poser_v(x >> 1, y >> 1)
+            return True
+        return False
+
+    def retirer_mur(self, x, y, orientation):
+        """
+        Fonction retirant un mur posé (utilisée pour annuler un coup pendant la recherche).
+        """
+        n = self.taille
+        r, c = x >> 1, y >> 1
+        s = r * (n - 1) + c
+        if orientation == "h":
+            self.murs_h &= ~(1 << s)
+            self.bloque_bas &= ~(0b11 << (r * n + c))
+        else:
+            self.murs_v &= ~(1 << s)
+            self.bloque_droite &= ~((1 << (r * n + c)) | (1 << ((r + 1) * n + c)))
+
+    def peut_fermer_chemin(self, x, y, orientation) -> bool:
+        """
+        Fonction indiquant si un mur (pas encore posé) peut séparer le plateau en plusieurs zones.
+        Pour fermer une zone, le mur doit s'appuyer en au moins deux de ses trois points (extrémités, centre)
+        sur des murs existants ou sur le bord ; sinon aucun chemin ne peut être coupé et la recherche de chemin est
+        inutile.
+        """
+        s = self.emplacement(x, y)
+        appuis = self._geo.appuis_h[s] if orientation == "h" else self._geo.appuis_v[s]
+        murs_h, murs_v = self.murs_h, self.murs_v
+        contacts = 0
+        for bord, h, v in appuis:
+            if bord or murs_h & h or murs_v & v:
+                contacts += 1
+                if contacts >= 2:
+                    return True
+        return False
+
+    def passages_mur(self, x, y, orientation) -> int:
+        """
+        Fonction retournant les passages fermés par un mur, en bits de bloque_bas (mur h) ou de bloque_droite (mur v).
+        """
+        s = self.emplacement(x, y)
+        return self._geo.passages_h[s] if orientation == "h" else self._geo.passages_v[s]
+
+    def masques_chemin(self, champ: list, start: tuple) -> tuple:
+        """
+        Fonction retournant un plus court chemin de `start` vers la ligne d'arrivée du champ, sous forme de deux masques
+        de passages (vers le bas, vers la droite) comparables à passages_mur. On descend simplement le champ de
+        distances.
+        """
+        n = self.taille
+        bas = droite = 0
+        i = self.indice(*start)
+        d = champ[i]
+        if d == math.inf:
+            return (0, 0)
+        while d > 0:
+            for v in self.voisins(i):
+                if champ[v] == d - 1:
+                    break
+            if v == i + n:
+                bas |= 1 << i
+            elif v == i - n:
+                bas |= 1 << v
+            elif v == i + 1:
+                droite |= 1 << i
+            else:
+                droite |= 1 << v
+            i, d = v, d - 1
+        return (bas, droite)
+
+    def mur_entre(self, x0, y0, x1, y1) -> bool:
+        """
+        Fonction indiquant si un mur sépare deux cases voisines (coordonnées de matrice).
+        """
+        if x1 == x0:
+            i = self.indice(x0, min(y0, y1))
+            return bool(self.bloque_droite >> i & 1)
+        i = self.indice(min(x0, x1), y0)
+        return bool(self.bloque_bas >> i & 1)
+
+    def voisins(self, i) -> list:
+        """
+        Fonction retournant les indices des cases accessibles depuis la case i (sans tenir compte des pions).
+        """
+        n = self.taille
+        res = []
+        if i >= n and not self.bloque_bas >> (i - n) & 1:
+            res.append(i - n)
+        if not self.bloque_bas >> i & 1:
+            res.append(i + n)
+        if i % n and not self.bloque_droite >> (i - 1) & 1:
+            res.append(i - 1)
+        if not self.bloque_droite >> i & 1:
+            res.append(i + 1)
+        return res
+
+    def etendre(self, front: int) -> int:
+        """
+        Fonction retournant l'ensemble des cases atteignables en un pas depuis l'ensemble de cases `front`.
+        """
+        n = self.taille
+        bb, bd = self.bloque_bas, self.bloque_droite
+        return (((front & ~bb) << n) | ((front >> n) & ~bb)
+                | ((front & ~bd) << 1) | ((front >> 1) & ~bd))
+
+    def distance(self, start: tuple, target_line: int) -> float:
+        """
+        Fonction retournant la distance entre `start` et la ligne `target_line` (propagation par masques de bits).
+        Si pas de chemin la fonction renvoie la valeur infini.
+        """
+        cible = self._geo.lignes[target_line >> 1]
+        front = vus = 1 << self.indice(*start)
+        d = 0
+        while not front & cible:
+            front = self.etendre(front) & ~vus
+            if not front:
+                return math.inf
+            vus |= front
+            d += 1
+        return d
+
+    def chemin_existe(self, start: tuple, target_line: int) -> bool:
+        """
+        Vérifie s'il existe un chemin libre (sans murs) depuis `start`
+        jusqu'à n'importe quelle cellule sur la ligne `target_line`.
+        """
+        return self.distance(start, target_line) != math.inf
+
+    def chemin(self, start: tuple, target_line: int) -> list:
+        """
+        Fonction retournant un plus court chemin (liste de coordonnées) entre `start` et la ligne `target_line`.
+        """
+        n = self.taille
+        depart = self.indice(*start)
+        ligne = target_line >> 1
+        parents = {depart: None}
+        q = deque([depart])
+        while q:
+            i = q.popleft()
+            if i // n == ligne:
+                chemin = []
+                while i is not None:
+                    chemin.append(self.coordonnees(i))
+                    i = parents[i]
+                return chemin[::-1]
+            for v in self.voisins(i):
+                if v not in parents:
+                    parents[v] = i
+                    q.append(v)
+        return []
+
+    def champ_distances(self, target_line: int) -> list:
+        """
+        Fonction retournant la distance de chaque case à la ligne `target_line` (math.inf si inaccessible).
+        Le plateau étant non orienté, on propage simplement depuis toute la ligne d'arrivée.
+        """
+        champ = [math.inf] * self._geo.nb_cases
+        front = vus = self._geo.lignes[target_line >> 1]
+        d = 0
+        while front:
+            f = front
+            while f:
+                bit = f & -f
+                champ[bit.bit_length() - 1] = d
+                f ^= bit
+            front = self.etendre(front) & ~vus
+            vus |= front
+            d += 1
+        return champ
+
+    def aretes_mur(self, x, y, orientation) -> tuple:
+        """
+        Fonction retournant les deux passages (paires d'indices de cases) fermés par un mur.
+        """
+        n = self.taille
+        i = (x >> 1) * n + (y >> 1)
+        if orientation == "h":
+            return ((i, i + n), (i + 1, i + n + 1))
+        return ((i, i + 1), (i + n, i + n + 1))
+
+    def mettre_a_jour_champ(self, champ: list, aretes, target_line: int) -> list:
+        """
+        Fonction mettant à jour un champ de distances après la fermeture des passages `aretes` (le mur est déjà posé).
+        Seules les cases ayant perdu tous leurs plus courts chemins sont recalculées ; si la région touchée devient
+        trop grande, il est plus rapide de tout recalculer par masques de bits. Le champ reçu n'est jamais
+        modifié : on retourne soit le même champ (rien n'a changé), soit un nouveau champ.
+        """
+        # 1. cases qui ont perdu le voisin par lequel passait un plus court chemin
+        candidats = []
+        for a, b in aretes:
+            da, db = champ[a], champ[b]
+            if da == math.inf:
+                continue
+            if da == db + 1:
+                heappush(candidats, (da, a))
+            elif db == da + 1:
+                heappush(candidats, (db, b))
+        if not candidats:
+            return champ
+
+        # 2. par distance croissante : une case est touchée si plus aucun voisin non touché n'est à distance d-1
+        touches = set()
+        traites = set()
+        seuil = self._geo.nb_cases // 16
+        while candidats:
+            d, v = heappop(candidats)
+            if v in traites:
+                continue
+            traites.add(v)
+            voisins = self.voisins(v)
+            if any(champ[u] == d - 1 and u not in touches for u in voisins):
+                continue
+            touches.add(v)
+            if len(touches) > seuil:
+                return self.champ_distances(target_line)
+            for w in voisins:
+                if champ[w] == d + 1:
+                    heappush(candidats, (d + 1, w))
+        if not touches:
+            return champ
+
+        # 3. nouvelles distances des cases touchées, depuis le bord de la région (Dijkstra à poids unitaires)
+        nouveau = list(champ)
+        tas = []
+        for v in touches:
+            d = min((champ[u] for u in self.voisins(v) if u not in touches), default=math.inf) + 1
+            nouveau[v] = d
+            if d != math.inf:
+                heappush(tas, (d, v))
+        while tas:
+            d, v = heappop(tas)
+            if d > nouveau[v]:
+                continue
+            for w in self.voisins(v):
+                if w in touches and d + 1 < nouveau[w]:
+                    nouveau[w] = d + 1
+                    heappush(tas, (d + 1, w))
+        return nouveau
@@ -0,0 +1,51 @@
+class OrdreCoups:
+    """
+    Classe gérant l'ordre dans lequel minimax essaie les coups : d'abord le coup de la table de transposition,
+    ensuite les coups « killer » de la même profondeur de l'arbre (ply), puis le reste trié par score d'historique.
+    Elle compte aussi les coupures alpha-bêta, pour mesurer la qualité de l'ordre (coupure sur le premier coup).
+    """
+    NB_KILLERS = 2
+
+    def __init__(self):
+        """
+        Fonction d'initialisation de la classe.
+        """
+        self.killers = {}  # ply -> liste des derniers coups ayant provoqué une coupure
+        self.historique = [{}, {}]  # par joueur : coup -> score (profondeur² cumulée des coupures)
+        self.coupures = 0
+        self.coupures_premier_coup = 0
+
+    def ordonner(self, coups: list, ply: int, tour: int, coup_table=None) -> list:
+        """
+        Fonction retournant les coups dans l'ordre où les chercher.
+        """
+        historique = self.historique[tour]
+        en_tete = []
+        if coup_table is not None and coup_table in coups:
+            en_tete.append(coup_table)
+        for coup in self.killers.get(ply, ()):
+            if coup in coups and coup not in en_tete:
+                en_tete.append(coup)
+        # tri stable : à score d'historique égal on garde l'ordre de génération
+        reste = sorted((c for c in coups if c not in en_tete), key=lambda c: -historique.get(c, 0))
+        return en_tete + reste
+
+    def enregistrer_coupure(self, coup, ply: int, tour: int, profondeur: int, rang: int):
+        """
+        Fonction appelée quand `coup`, essayé en position `rang`, provoque une coupure.
+        """
+        self.coupures += 1
+        if rang == 0:
+            self.coupures_premier_coup += 1
+        killers = self.killers.setdefault(ply, [])
+        if coup not in killers:
+            killers.insert(0, coup)
+            del killers[self.NB_KILLERS:]
+        historique = self.historique[tour]
+        historique[coup] = historique.get(coup, 0) + profondeur * profondeur
+
+    def taux_premier_coup(self) -> float:
+        """
+        Fonction retournant la proportion des coupures obtenues dès le premier coup essayé.
+        """
+        return self.coupures_premier_coup / self.coupures if self.coupures else 0.0
@@ -0,0 +1,141 @@
+import random
+import time
+from Object.Plateau import Plateau
+from Object.Joueur import Joueur
+from Object.EtatCompact import BITS_NB_MURS
+from GameState import GameState, TRANSPOSITION_TABLE
+from Recherche import ContexteRecherche, StatistiquesRecherche
+from LivreOuvertures import ouvrir_livre
+from RechercheParallele import fermer_pool
+
+# Clés d'un niveau d'IA (dictionnaires IA_LEVELS de Quoridor.py et benchmark_ia.py) :
+# "profondeur" de la recherche minimax, "epsilon" probabilité de jouer un coup au hasard, "poids_avancer",
+# "poids_bloquer", "poids_murs" et "poids_avance" poids de l'évaluation.
+# Un niveau peut aussi être exprimé en temps : avec "temps_max" (secondes par coup), la recherche approfondit
+# progressivement et "profondeur" n'est plus utilisée. "evaluation_lot": True évalue le dernier niveau avec NumPy.
+# "workers": N répartit les coups de la racine sur N processus (profondeur fixe).
+# "livre": chemin d'un livre d'ouvertures (voir LivreOuvertures.py) consulté avant de chercher.
+# "finale": False désactive le module de fin de partie (voir Finale.py), actif par défaut.
+# "moteur": "mcts" remplace minimax par MCTS (voir MCTS.py), arrêté après "iterations" itérations ou à "temps_max".
+# "pvs": True active la principal variation search, "aspiration": True les fenêtres d'aspiration (avec "temps_max").
+# "lmr": True réduit la profondeur des derniers murs essayés, "coup_nul": True active l'élagage par coup nul (aux
+# noeuds à fenêtre nulle, donc avec "pvs").
+# "filtre_murs": False cherche parmi tous les murs légaux (par défaut, seulement les murs intéressants).
+# Ces clés sont transmises telles quelles à choix_coup ("livre", le chemin d'un livre d'ouvertures, est ouvert par
+# ouvrir_livre)
+PARAMETRES_CHOIX_COUP = ("profondeur", "epsilon", "poids_avancer", "poids_bloquer", "poids_murs", "poids_avance",
+                         "temps_max", "evaluation_lot", "workers", "finale",
+                         "moteur", "iterations", "pvs", "aspiration", "lmr", "coup_nul",
+                         "filtre_murs")
+
+
+# Tailles de plateau jouables (9 = plateau standard)
+TAILLE_MIN = 5
+TAILLE_MAX = 19
+
+
+def murs_par_defaut(taille: int) -> int:
+    """
+    Fonction retournant le nombre de murs de chaque joueur au départ quand il n'est pas donné : 10 sur le plateau
+    standard, une de plus que la taille sur les variantes.
+    """
+    return taille + 1
+
+
+def verifier_variante(taille: int, nb_murs=None) -> int:
+    """
+    Fonction vérifiant une taille de plateau et un nombre de murs par joueur (None = murs_par_defaut) et retournant
+    ce nombre de murs. Lève ValueError si la variante n'est pas jouable.
+    """
+    if not TAILLE_MIN <= taille <= TAILLE_MAX:
+        raise ValueError(f"taille de plateau {taille} hors de [{TAILLE_MIN}, {TAILLE_MAX}]")
+    if nb_murs is None:
+        nb_murs = murs_par_defaut(taille)
+    # un joueur ne peut pas avoir plus de murs que d'emplacements (taille des tables de Zobrist et d'EtatCompact)
+    nb_murs_max = min((taille - 1) * (taille - 1), (1 << BITS_NB_MURS) - 1)
+    if not 0 <= nb_murs <= nb_murs_max:
+        raise ValueError(f"nombre de murs {nb_murs} hors de [0, {nb_murs_max}] pour un plateau {taille}x{taille}")
+    return nb_murs
+
+
+def etat_initial(taille=9, graine=0, nb_murs=None) -> GameState:
+    """
+    Fonction retournant l'état de départ d'une partie : les deux pions au milieu de leur première ligne, nb_murs murs
+    chacun (None = murs_par_defaut(taille)).
+    """
+    nb_murs = verifier_variante(taille, nb_murs)
+    plateau = Plateau(taille)
+    max_idx = 2 * plateau.taille - 2
+    mid = plateau.taille - 1
+    joueurs = [
+        Joueur("1", (0, mid), max_idx, nb_murs),
+        Joueur("2", (max_idx, mid), 0, nb_murs)
+    ]
+    for j in joueurs:
+        plateau.placer_joueur(j)
+    return GameState(plateau, joueurs, 0, graine)
+
+
+def jouer_partie_auto(config_ia1: dict, config_ia2: dict, max_coups=200, graine=0, cache=None, taille=9,
+                      nb_murs=None) -> dict:
+    """
+    Fonction jouant une partie entre deux IAs (configurations au format IA_LEVELS) sans rien afficher.
+    Retourne l'enregistrement de la partie : pour chaque coup joué, le coup, la durée de la recherche (secondes),
+    le nombre de noeuds visités, la profondeur atteinte et le score du coup (None quand choix_coup l'a joué sans
+    recherche : coup forcé, coup gagnant ou coup aléatoire). gagnant vaut "1", "2" ou None (aucun coup possible ou
+    max_coups atteint). statistiques contient, pour chaque IA, le cumul des StatistiquesRecherche de ses coups
+    (sous forme de dictionnaire, voir StatistiquesRecherche.en_dict).
+    Tous les choix aléatoires (génération des murs, coups epsilon) dérivent de la graine : à graine égale et à
+    profondeur fixe, deux parties ont les mêmes coups, les mêmes scores et les mêmes nombres de noeuds.
+    cache (CacheRecherche) complète la table de transposition et reçoit les résultats profonds de la partie.
+    Ses entrées sont séparées par profil (poids et options de recherche) mais pas par graine : une entrée écrite
+    par une partie d'une autre graine (autres murs candidats) peut changer les coups et les scores. Une partie jouée
+    avec un cache n'est donc pas reproductible à partir de sa seule graine.
+    taille et nb_murs choisissent la variante jouée (voir etat_initial).
+    """
+    # chaque partie repart d'une table de transposition vide, comme une partie de Quoridor
+    TRANSPOSITION_TABLE.clear()
+    if cache is not None:
+        cache.brancher(TRANSPOSITION_TABLE)
+    state = etat_initial(taille, graine, nb_murs)
+    rng = random.Random(graine)
+    configs = [config_ia1, config_ia2]
+    partie = {"graine": graine, "taille": taille, "nb_murs": state.joueurs[0].nb_murs, "coups": [], "temps": [],
+              "noeuds": [], "profondeurs": [], "scores": [], "gagnant": None}
+    statistiques = [StatistiquesRecherche(), StatistiquesRecherche()]
+
+    while len(partie["coups"]) < max_coups and state.get_winner() is None:
+        tour = state.tour
+        params = {cle: valeur for cle, valeur in configs[tour].items() if cle in PARAMETRES_CHOIX_COUP}
+        contexte = ContexteRecherche()
+        debut = time.perf_counter()
+        coup = state.choix_coup(IA_index=tour, contexte=contexte, rappel_statistiques=statistiques[tour].ajouter,
+                                rng=rng, livre=ouvrir_livre(configs[tour].get("livre")), cache=cache, **params)
+        duree = time.perf_counter() - debut
+        if coup is None:
+            break
+        partie["coups"].append(coup)
+        partie["temps"].append(duree)
+        partie["noeuds"].append(contexte.noeuds)
+        partie["profondeurs"].append(contexte.profondeur_atteinte)
+        partie["scores"].append(contexte.score)
+        state.do_move(coup)
+
+    # le pool des recherches parallèles (et les tables de ses processus) ne sert que pendant la partie
+    fermer_pool()
+    partie["gagnant"] = state.get_winner()
+    partie["nb_coups"] = len(partie["coups"])
+    partie["statistiques"] = [stats.en_dict() for stats in statistiques]
+    return partie
+
+
+def parties_auto(config_ia1: dict, config_ia2: dict, nb_parties=None, max_coups=200, graine=0, cache=None,
+                 taille=9, nb_murs=None):
+    """
+    Générateur de parties entre deux IAs : produit les enregistrements de jouer_partie_auto un par un,
+    indéfiniment si nb_parties vaut None. La partie numéro k est jouée avec la graine graine + k.
+    """
+    numero = 0
+    while nb_parties is None or numero < nb_parties:
+        yield jouer_partie_auto(config_ia1, config_ia2, max_coups, graine + numero, cache, taille, nb_murs)
+        numero += 1
@@ -1,9 +1,16 @@
+import argparse
+import random
 import sys
 from Object.Plateau import Plateau
 from Object.Joueur import Joueur
-from GameState import GameState
+from GameState import GameState, TRANSPOSITION_TABLE
+from Anticipation import Anticipation
+from LivreOuvertures import ouvrir_livre
+from PartieAuto import verifier_variante
+from RechercheParallele import fermer_pool
 
-# Définition des parametres des différents niveaux d'IA
+# Définition des parametres des différents niveaux d'IA (clés décrites dans PartieAuto.py, avant
+# PARAMETRES_CHOIX_COUP)
 IA_LEVELS = {
     "facile": {
         "profondeur": 1,
@@ -25,6 +32,14 @@ IA_LEVELS = {
         "poids_avancer": 1.5,
         "poids_bloquer": 1,
         "poids_murs": 0.4
+    },
+    "mcts": {
+        "moteur": "mcts",
+        "iterations": 300,
+        "epsilon": 0,
+        "poids_avancer": 1.5,
+        "poids_bloquer": 1,
+        "poids_murs": 0.4
     }
 }
 
@@ -32,17 +47,24 @@ class Quoridor:
     """
     Classe représentant le jeu Quoridor
     """
-    def __init__(self, ai_flags=None, ai_level="moyen"):
+    def __init__(self, ai_flags=None, ai_level="moyen", afficher_stats=True, graine=None, cache=None, taille=9,
+                 nb_murs=None, anticiper=True):
         """
         Fonction d'initialisation de la classe
+        La graine fixe tous les choix aléatoires des IAs (None = graine tirée au hasard) : avec la même graine et les
+        mêmes coups humains, une partie se rejoue à l'identique.
+        cache (CacheRecherche) complète la table de transposition et garde les résultats profonds des IAs.
+        taille (5 à 19) et nb_murs (murs de chaque joueur, None = taille + 1) permettent de jouer une variante.
+        anticiper fait réfléchir l'IA pendant le tour d'un joueur humain (voir Anticipation), sauf avec MCTS.
         """
-        self.plateau = Plateau()
+        nb_murs = verifier_variante(taille, nb_murs)
+        self.plateau = Plateau(taille)
         max_idx = 2 * self.plateau.taille - 2
         mid    = self.plateau.taille - 1
         # liste des joueurs
         self.joueurs = [
-            Joueur("1", (0,    mid), max_idx),
-            Joueur("2", (max_idx, mid), 0)
+            Joueur("1", (0,    mid), max_idx, nb_murs),
+            Joueur("2", (max_idx, mid), 0, nb_murs)
         ]
         for j in self.joueurs:
             self.plateau.placer_joueur(j)
@@ -50,6 +72,19 @@ class Quoridor:
         self.ai_flags = ai_flags or [False, False]
         self.ai_level = ai_level
         self.ai_levels = {0: ai_level, 1: ai_level}
+        # affichage des statistiques de recherche après chaque coup de l'IA
+        self.afficher_stats = afficher_stats
+        if graine is None:
+            graine = random.SystemRandom().getrandbits(32)
+        self.graine = graine
+        self.rng = random.Random(graine)
+        # nouvelle partie : on repart d'une table de transposition vide (ou des résultats du cache)
+        TRANSPOSITION_TABLE.clear()
+        self.cache = cache
+        if cache is not None:
+            cache.brancher(TRANSPOSITION_TABLE)
+        self.anticiper = anticiper
+        self.anticipation = None  # réflexion en cours pendant le tour du joueur humain
 
     def afficher_plateau(self):
         """
@@ -60,6 +95,13 @@ class Quoridor:
             print(f"Joueur {j.nom} : murs restants = {j.nb_murs}")
         print()
 
+    def afficher_statistiques(self, statistiques):
+        """
+        Fonction d'affichage des statistiques de la recherche de l'IA.
+        """
+        if self.afficher_stats:
+            print(statistiques)
+
     def verifier_victoire(self):
         """
         Fonction de vérification de la victoire
@@ -69,6 +111,48 @@ class Quoridor:
                 return j.nom
         return None
 
+    @staticmethod
+    def options_ia(params: dict) -> dict:
+        """
+        Fonction retournant les paramètres de choix_coup d'un niveau d'IA (au format IA_LEVELS). "profondeur" n'est
+        lue que par minimax, elle peut manquer dans un niveau MCTS.
+        """
+        return {
+            "profondeur": params.get("profondeur"),
+            "epsilon": params["epsilon"],
+            "temps_max": params.get("temps_max"),
+            "evaluation_lot": params.get("evaluation_lot", False),
+            "workers": params.get("workers"),
+            "livre": ouvrir_livre(params.get("livre")),
+            "finale": params.get("finale", True),
+            "moteur": params.get("moteur", "minimax"),
+            "iterations": params.get("iterations"),
+            "pvs": params.get("pvs", False),
+            "aspiration": params.get("aspiration", False),
+            "lmr": params.get("lmr", False),
+            "coup_nul": params.get("coup_nul", False),
+            "filtre_murs": params.get("filtre_murs", True)
+        }
+
+    def arreter_anticipation(self, state=None) -> dict:
+        """
+        Fonction arrêtant la réflexion de l'IA pendant le tour humain et retournant ses recherches terminées (None
+        si elle ne réfléchissait pas). Si state est la position qu'elle est en train de chercher, la recherche est
+        terminée avant de rendre la main.
+        """
+        if self.anticipation is None:
+            return None
+        anticipation, self.anticipation = self.anticipation, None
+        return anticipation.arreter(state)
+
+    def terminer(self):
+        """
+        Fonction libérant ce que les IAs gardent d'un coup à l'autre : la réflexion pendant le tour humain et le pool
+        des recherches parallèles.
+        """
+        self.arreter_anticipation()
+        fermer_pool()
+
     def jouer_tour(self):
         """
         Fonction permettant de jouer un tour
@@ -80,24 +164,33 @@ class Quoridor:
             # Dans le cas où le joueur est une IA
             current_ai_level = self.ai_levels.get(self.tour, self.ai_level)
             print(f"--- Tour du joueur {j.nom} (IA - {current_ai_level}) ---")
-            state = GameState(self.plateau, self.joueurs, self.tour)
-            
-            params = IA_LEVELS[current_ai_level]
-            profondeur = params["profondeur"]
-            epsilon_base = params["epsilon"]
+            state = GameState(self.plateau, self.joueurs, self.tour, self.graine)
             
-            epsilon = epsilon_base
+            options = self.options_ia(IA_LEVELS[current_ai_level])
+            # la réflexion faite pendant le tour humain s'arrête ici : la table de transposition est à nouveau libre
+            reponses = self.arreter_anticipation(state)
             
             best_move = state.choix_coup(
-                profondeur=profondeur,
                 IA_index=self.tour,
-                epsilon=epsilon
+                rappel_statistiques=self.afficher_statistiques,
+                rng=self.rng,
+                cache=self.cache,
+                anticipation=reponses,
+                **options
             )
+            if best_move is None:
+                print("Aucun coup possible!")
             print("L'IA joue :", best_move)
             new_state = state.apply_move(best_move)
-            self.plateau = new_state.plateau
+            # l'IA joue sur le plateau compact, on revient à la matrice pour l'affichage et les coups humains
+            self.plateau = new_state.plateau.vers_plateau()
             self.joueurs = new_state.joueurs
             self.tour = new_state.tour
+            # pendant que le joueur humain réfléchit, l'IA cherche d'avance ses réponses aux coups probables
+            if (self.anticiper and not self.ai_flags[self.tour] and options["moteur"] == "minimax"
+                    and new_state.get_winner() is None):
+                self.anticipation = Anticipation(new_state, 1 - self.tour, options)
+                self.anticipation.demarrer()
             return
 
         # Dans le cas ou le jour est un humain
@@ -105,6 +198,7 @@ class Quoridor:
         choix = input("(d)éplacer, (m)ur, (q)uitter : ").strip().lower()
         # Action réalisé en fonction de la saisie de l'utilisateur
         if choix == "q":
+            self.terminer()
             print("Au revoir !")
             sys.exit()
         if choix == "d":
@@ -140,6 +234,14 @@ class Quoridor:
 
 if __name__ == "__main__":
     # Lancement du programme
+    parser = argparse.ArgumentParser(description="Jeu de Quoridor")
+    parser.add_argument("--taille", type=int, default=9, help="taille du plateau (5 à 19)")
+    parser.add_argument("--murs", type=int, default=None, help="murs par joueur (défaut : taille + 1)")
+    args = parser.parse_args()
+    try:
+        verifier_variante(args.taille, args.murs)
+    except ValueError as erreur:
+        parser.error(str(erreur))
     mode = None
     # Choix du mode de jeux
     while mode not in ("1","2","3"):
@@ -150,33 +252,36 @@ if __name__ == "__main__":
         # Condition permettant de redemandé une saisie à l'utilisateur pour choisir le niveau de l'IA
         ai_flags[1] = True
         level = None
-        while level not in ("1", "2", "3"):
-            level = input("Niveau de l'IA: 1) Facile  2) Moyen  3) Difficile : ").strip()
+        while level not in ("1", "2", "3", "4"):
+            level = input("Niveau de l'IA: 1) Facile  2) Moyen  3) Difficile  4) MCTS : ").strip()
         ai_level = {
             "1": "facile",
             "2": "moyen",
-            "3": "difficile"
+            "3": "difficile",
+            "4": "mcts"
         }[level]
     elif mode == "3":
         # Condition permettant de redemandé une saisie à l'utilisateur pour choisir le niveau des IAs
         ai_flags = [True, True]
         level1 = None
-        while level1 not in ("1", "2", "3"):
-            level1 = input("Niveau de l'IA 1: 1) Facile  2) Moyen  3) Difficile : ").strip()
+        while level1 not in ("1", "2", "3", "4"):
+            level1 = input("Niveau de l'IA 1: 1) Facile  2) Moyen  3) Difficile  4) MCTS : ").strip()
         level2 = None
-        while level2 not in ("1", "2", "3"):
-            level2 = input("Niveau de l'IA 2: 1) Facile  2) Moyen  3) Difficile : ").strip()
+        while level2 not in ("1", "2", "3", "4"):
+            level2 = input("Niveau de l'IA 2: 1) Facile  2) Moyen  3) Difficile  4) MCTS : ").strip()
         
         ai_levels = {
             0: {
                 "1": "facile",
                 "2": "moyen",
-                "3": "difficile"
+                "3": "difficile",
+                "4": "mcts"
             }[level1],
             1: {
                 "1": "facile",
                 "2": "moyen",
-                "3": "difficile"
+                "3": "difficile",
+                "4": "mcts"
             }[level2]
         }
         ai_level = "moyen"
@@ -184,7 +289,7 @@ if __name__ == "__main__":
         ai_level = "moyen"
 
     # Création d'une instance de la classe Quoridor
-    jeu = Quoridor(ai_flags=ai_flags, ai_level=ai_level)
+    jeu = Quoridor(ai_flags=ai_flags, ai_level=ai_level, taille=args.taille, nb_murs=args.murs)
     
     if mode == "3":
         jeu.ai_levels = ai_levels
@@ -192,5 +297,6 @@ if __name__ == "__main__":
         jeu.afficher_plateau()
         if (g := jeu.verifier_victoire()) is not None:
             print(f"Le joueur {g} a gagné !")
+            jeu.terminer()
             break
         jeu.jouer_tour()
@@ -0,0 +1,230 @@
+import time
+from OrdreCoups import OrdreCoups
+
+
+class TempsEcoule(Exception):
+    """
+    Exception levée dans minimax quand le temps alloué au coup est dépassé (ou quand la recherche est annulée).
+    """
+
+
+class StatistiquesRecherche:
+    """
+    Classe regroupant les mesures d'une recherche (ou, après ajouter, de plusieurs recherches) : noeuds visités,
+    lectures de la table de transposition, coupures alpha-bêta, temps passé à générer les coups et à évaluer,
+    et durée / noeuds de chaque profondeur terminée.
+    """
+    # compteurs additionnés par ajouter
+    COMPTEURS = ("recherches", "noeuds", "duree", "lectures_table", "succes_table", "coupures_table",
+                 "coupures", "coupures_premier_coup", "temps_generation", "temps_evaluation", "coups_livre",
+                 "coups_finale", "coups_anticipes")
+
+    def __init__(self):
+        """
+        Fonction d'initialisation de la classe.
+        """
+        self.recherches = 0
+        self.noeuds = 0
+        self.duree = 0.0
+        self.profondeur = 0  # profondeur maximale terminée
+        self.score = None  # score du coup choisi (une seule recherche)
+        self.lectures_table = 0
+        self.succes_table = 0  # entrées trouvées dans la table, quelle que soit leur profondeur
+        self.coupures_table = 0  # noeuds dont la valeur a été donnée directement par la table
+        self.coupures = 0
+        self.coupures_premier_coup = 0
+        self.temps_generation = 0.0
+        self.temps_evaluation = 0.0
+        self.coups_livre = 0  # coups joués depuis le livre d'ouvertures, sans recherche
+        self.coups_finale = 0  # coups joués par le module de fin de partie (Finale)
+        self.coups_anticipes = 0  # coups trouvés pendant le temps de réflexion de l'adversaire (Anticipation)
+        self.profondeurs = {}  # profondeur -> [durée cumulée, noeuds cumulés]
+
+    @property
+    def noeuds_par_seconde(self) -> float:
+        """
+        Fonction retournant le nombre de noeuds visités par seconde.
+        """
+        return self.noeuds / self.duree if self.duree else 0.0
+
+    @property
+    def taux_succes_table(self) -> float:
+        """
+        Fonction retournant la proportion des lectures de la table qui ont trouvé l'état.
+        """
+        return self.succes_table / self.lectures_table if self.lectures_table else 0.0
+
+    @property
+    def taux_premier_coup(self) -> float:
+        """
+        Fonction retournant la proportion des coupures obtenues dès le premier coup essayé.
+        """
+        return self.coupures_premier_coup / self.coupures if self.coupures else 0.0
+
+    def ajouter(self, autre: "StatistiquesRecherche"):
+        """
+        Fonction ajoutant les mesures d'une autre recherche (pour les cumuler sur une partie, un niveau...).
+        """
+        for nom in self.COMPTEURS:
+            setattr(self, nom, getattr(self, nom) + getattr(autre, nom))
+        self.profondeur = max(self.profondeur, autre.profondeur)
+        self.score = None
+        for p, (duree, noeuds) in autre.profondeurs.items():
+            cumul = self.profondeurs.setdefault(p, [0.0, 0])
+            cumul[0] += duree
+            cumul[1] += noeuds
+
+    def en_dict(self) -> dict:
+        """
+        Fonction retournant les mesures sous forme de dictionnaire sérialisable en JSON.
+        """
+        donnees = {nom: getattr(self, nom) for nom in self.COMPTEURS}
+        donnees["profondeur"] = self.profondeur
+        donnees["score"] = self.score
+        donnees["profondeurs"] = {str(p): list(v) for p, v in self.profondeurs.items()}
+        return donnees
+
+    @classmethod
+    def depuis_dict(cls, donnees: dict) -> "StatistiquesRecherche":
+        """
+        Fonction reconstruisant des statistiques à partir du dictionnaire de en_dict.
+        """
+        stats = cls()
+        for nom in cls.COMPTEURS:
+            setattr(stats, nom, donnees.get(nom, 0))
+        stats.profondeur = donnees["profondeur"]
+        stats.score = donnees["score"]
+        stats.profondeurs = {int(p): list(v) for p, v in donnees["profondeurs"].items()}
+        return stats
+
+    def __str__(self) -> str:
+        """
+        Fonction retournant les statistiques sous forme de texte (quelques lignes).
+        """
+        lignes = [
+            f"{self.noeuds} noeuds en {self.duree:.3f} s ({self.noeuds_par_seconde:.0f} noeuds/s), "
+            f"profondeur {self.profondeur}" + (f", score {self.score:g}" if self.score is not None else ""),
+            f"table : {self.taux_succes_table:.0%} de succès sur {self.lectures_table} lectures, "
+            f"{self.coupures_table} valeurs réutilisées",
+            f"coupures : {self.coupures}, dont {self.taux_premier_coup:.0%} au premier coup",
+            f"génération des coups : {self.temps_generation:.3f} s, évaluation : {self.temps_evaluation:.3f} s",
+        ]
+        if self.coups_livre:
+            lignes.append(f"coups du livre d'ouvertures : {self.coups_livre}")
+        if self.coups_finale:
+            lignes.append(f"coups de fin de partie : {self.coups_finale}")
+        if self.coups_anticipes:
+            lignes.append(f"coups anticipés : {self.coups_anticipes}")
+        if self.profondeurs:
+            lignes.append("par profondeur : " + ", ".join(f"{p}: {duree:.3f} s / {noeuds} noeuds"
+                                                          for p, (duree, noeuds) in sorted(self.profondeurs.items())))
+        return "\n".join(lignes)
+
+
+class ContexteRecherche:
+    """
+    Classe regroupant ce qui est partagé par tous les noeuds d'une même recherche (échéance, compteurs,
+    ordre des coups). Un contexte peut être fourni à choix_coup pour consulter ces informations après le coup.
+    """
+    def __init__(self, temps_max=None, evaluation_lot=False, pvs=False, lmr=False, coup_nul=False):
+        """
+        Fonction d'initialisation de la classe. temps_max est le budget en secondes (None = pas de limite),
+        evaluation_lot active l'évaluation vectorisée des feuilles (voir EvaluationLot), pvs la recherche à
+        fenêtre nulle des coups qui suivent le premier (principal variation search), lmr la réduction de
+        profondeur des derniers murs essayés (late move reductions) et coup_nul l'élagage par coup nul.
+        """
+        self.evaluation_lot = evaluation_lot
+        self.pvs = pvs
+        self.lmr = lmr
+        self.coup_nul = coup_nul
+        self.passe = False  # un coup nul est en cours de recherche dans la branche
+        self.echeance = None
+        self.arret = None  # threading.Event : une fois levé, la recherche s'interrompt comme à l'échéance
+        self.debut = None
+        self.noeuds = 0
+        self.profondeur_atteinte = 0
+        self.score = None  # score du coup choisi, None si choix_coup l'a joué sans recherche
+        self.coupures_table = 0
+        self.temps_generation = 0.0
+        self.temps_evaluation = 0.0
+        self.coups_livre = 0
+        self.coups_finale = 0
+        self.coups_anticipes = 0
+        self.profondeurs = {}  # profondeur terminée -> [durée, noeuds]
+        self.ordre = OrdreCoups()
+        self._table = None
+        self._table_debut = (0, 0)
+        self.demarrer(temps_max)
+
+    def demarrer(self, temps_max=None, table=None):
+        """
+        Fonction (re)lançant le chronomètre de la recherche. Si la table de transposition utilisée est donnée,
+        ses compteurs sont relevés pour que statistiques() ne compte que les lectures faites depuis.
+        """
+        self.debut = time.perf_counter()
+        self.echeance = None if temps_max is None else self.debut + temps_max
+        if table is not None:
+            self._table = table
+            self._table_debut = (table.succes, table.echecs)
+
+    def options(self) -> dict:
+        """
+        Fonction retournant les options de recherche du contexte, pour créer un contexte équivalent dans un autre
+        processus (ContexteRecherche(**options)).
+        """
+        return {"evaluation_lot": self.evaluation_lot, "pvs": self.pvs, "lmr": self.lmr, "coup_nul": self.coup_nul}
+
+    def verifier_temps(self):
+        """
+        Fonction interrompant la recherche (exception TempsEcoule) si l'échéance est dépassée ou si l'arrêt a été
+        demandé.
+        """
+        if self.echeance is not None and time.perf_counter() >= self.echeance:
+            raise TempsEcoule()
+        if self.arret is not None and self.arret.is_set():
+            raise TempsEcoule()
+
+    def compteurs(self) -> tuple:
+        """
+        Fonction retournant les compteurs d'une recherche faite dans un autre processus, à ajouter au contexte
+        principal avec ajouter_compteurs.
+        """
+        return (self.noeuds, self.coupures_table, self.temps_generation, self.temps_evaluation,
+                self.ordre.coupures, self.ordre.coupures_premier_coup)
+
+    def ajouter_compteurs(self, compteurs: tuple):
+        """
+        Fonction ajoutant au contexte les compteurs retournés par compteurs().
+        """
+        noeuds, coupures_table, temps_generation, temps_evaluation, coupures, coupures_premier_coup = compteurs
+        self.noeuds += noeuds
+        self.coupures_table += coupures_table
+        self.temps_generation += temps_generation
+        self.temps_evaluation += temps_evaluation
+        self.ordre.coupures += coupures
+        self.ordre.coupures_premier_coup += coupures_premier_coup
+
+    def statistiques(self) -> StatistiquesRecherche:
+        """
+        Fonction retournant les statistiques de la recherche depuis le dernier appel à demarrer.
+        Les lectures de la table faites par les processus d'une recherche parallèle ne sont pas comptées.
+        """
+        stats = StatistiquesRecherche()
+        stats.recherches = 1
+        stats.noeuds = self.noeuds
+        stats.duree = time.perf_counter() - self.debut
+        stats.profondeur = self.profondeur_atteinte
+        stats.score = self.score
+        if self._table is not None:
+            stats.succes_table = self._table.succes - self._table_debut[0]
+            stats.lectures_table = stats.succes_table + self._table.echecs - self._table_debut[1]
+        stats.coupures_table = self.coupures_table
+        stats.coupures = self.ordre.coupures
+        stats.coupures_premier_coup = self.ordre.coupures_premier_coup
+        stats.temps_generation = self.temps_generation
+        stats.temps_evaluation = self.temps_evaluation
+        stats.coups_livre = self.coups_livre
+        stats.coups_finale = self.coups_finale
+        stats.coups_anticipes = self.coups_anticipes
+        stats.profondeurs = {p: list(v) for p, v in self.profondeurs.items()}
+        return stats
@@ -0,0 +1,107 @@
+import atexit
+import math
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from Recherche import ContexteRecherche
+
+# Tableau partagé entre les processus d'une recherche : score exact du coup de rang i, -inf si le coup n'a pas
+# dépassé sa borne alpha, NaN tant qu'il n'est pas terminé.
+_SCORES = None
+
+# Nombre minimal de coups de la racine que peut recevoir le tableau partagé du pool (il est agrandi si besoin)
+CAPACITE_SCORES = 256
+
+# Pool gardé d'une recherche à l'autre (créé au premier besoin) : ses processus gardent leur table de transposition
+# entre les coups. Tuple (pool, nombre de processus, tableau partagé des scores) ou None.
+_POOL = None
+
+
+def _initialiser_processus(scores):
+    """
+    Fonction exécutée au démarrage de chaque processus du pool : mémorise le tableau partagé des scores.
+    """
+    global _SCORES
+    _SCORES = scores
+
+
+def _chercher_coup(etat, rang, coup, profondeur, IA_index, poids, alpha, options) -> tuple:
+    """
+    Fonction exécutée dans un processus du pool : recherche d'un coup de la racine.
+    La borne alpha est le score du premier coup, relevé par les scores exacts déjà connus des coups de rang inférieur
+    (ceux que la recherche séquentielle aurait vus avant celui-ci).
+    """
+    for j in range(1, rang):
+        score = _SCORES[j]
+        if score == score and score > alpha:  # score == score : pas NaN
+            alpha = score
+    contexte = ContexteRecherche(**options)
+    etat.do_move(coup)
+    score = -etat.minimax(profondeur - 1, 1 - IA_index, -math.inf, -alpha, *poids, contexte=contexte, ply=1)
+    exact = score > alpha
+    _SCORES[rang] = score if exact else -math.inf
+    return rang, score, exact, contexte.compteurs()
+
+
+def _obtenir_pool(workers: int, nb_coups: int) -> tuple:
+    """
+    Fonction retournant le pool de `workers` processus et son tableau partagé d'au moins nb_coups scores, remis à NaN.
+    Le pool existant est réutilisé ; il n'est recréé que si le nombre de processus change ou si le tableau est trop
+    petit.
+    """
+    global _POOL
+    if _POOL is not None and (_POOL[1] != workers or len(_POOL[2]) < nb_coups):
+        fermer_pool()
+    if _POOL is None:
+        scores = multiprocessing.Array("d", max(nb_coups, CAPACITE_SCORES))
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_initialiser_processus, initargs=(scores,))
+        _POOL = (pool, workers, scores)
+    pool, _, scores = _POOL
+    for i in range(nb_coups):
+        scores[i] = math.nan
+    return pool, scores
+
+
+@atexit.register
+def fermer_pool():
+    """
+    Fonction arrêtant le pool des recherches parallèles (et vidant ainsi les tables de ses processus), par exemple à
+    la fin d'une partie. Le prochain appel à recherche_racine_parallele en recrée un.
+    """
+    global _POOL
+    if _POOL is not None:
+        _POOL[0].shutdown()
+        _POOL = None
+
+
+def recherche_racine_parallele(etat, coups_possibles, profondeur, IA_index, poids, workers,
+                               contexte: ContexteRecherche) -> tuple:
+    """
+    Fonction cherchant les coups de la racine sur un pool de `workers` processus (schéma « young brothers wait ») :
+    le premier coup est cherché seul avec la fenêtre complète, puis les autres en parallèle avec la borne alpha
+    partagée. Un coup n'est retenu que si son score est exact (strictement au-dessus de sa borne) ; à score égal
+    le coup de plus petit rang l'emporte, comme dans la recherche séquentielle, qui choisit donc le même coup.
+    Le pool est gardé pour les recherches suivantes (voir fermer_pool).
+    Retourne le meilleur coup et son score.
+    """
+    premier = coups_possibles[0]
+    annulation = etat.do_move(premier)
+    try:
+        meilleur_score = -etat.minimax(profondeur - 1, 1 - IA_index, -math.inf, math.inf, *poids,
+                                       contexte=contexte, ply=1)
+    finally:
+        etat.undo_move(annulation)
+    meilleur_coup = premier
+    if len(coups_possibles) == 1:
+        return meilleur_coup, meilleur_score
+
+    pool, _ = _obtenir_pool(workers, len(coups_possibles))
+    taches = [pool.submit(_chercher_coup, etat, rang, coup, profondeur, IA_index, poids, meilleur_score,
+                          contexte.options())
+              for rang, coup in enumerate(coups_possibles) if rang > 0]
+    resultats = [tache.result() for tache in taches]
+
+    for rang, score, exact, compteurs in sorted(resultats):
+        contexte.ajouter_compteurs(compteurs)
+        if exact and score > meilleur_score:
+            meilleur_score, meilleur_coup = score, coups_possibles[rang]
+    return meilleur_coup, meilleur_score
@@ -0,0 +1,146 @@
+from functools import lru_cache
+from Zobrist import MASQUE_64, _splitmix64
+
+# Nature de la valeur stockée dans une entrée
+EXACT = 0  # valeur exacte (elle était strictement entre alpha et beta)
+LOWER = 1  # borne inférieure (coupure beta, la vraie valeur est >= valeur)
+UPPER = 2  # borne supérieure (aucun coup n'a dépassé alpha, la vraie valeur est <= valeur)
+
+# Estimation de la taille mémoire d'une entrée (tuple + entiers + flottant + coup), utilisée pour memoire_mo
+OCTETS_PAR_ENTREE = 200
+
+
+@lru_cache(maxsize=256)
+def cle_profil(IA_index, poids_avancer, poids_bloquer, poids_murs, poids_avance, filtre_murs=True, lmr=False,
+               coup_nul=False) -> int:
+    """
+    Fonction retournant la clé 64 bits d'un profil de recherche : point de vue et poids de l'évaluation, et options
+    qui changent les coups cherchés (génération des murs, réductions, coup nul).
+    Elle est combinée (XOR) avec le hash de l'état pour que deux profils ne partagent jamais une entrée.
+    Le profil par défaut (murs filtrés, sans réduction ni coup nul) garde la clé du seul point de vue et des poids,
+    pour que les caches déjà écrits restent valables.
+    """
+    profil = (IA_index, poids_avancer, poids_bloquer, poids_murs, poids_avance)
+    if not filtre_murs or lmr or coup_nul:
+        profil += (filtre_murs, lmr, coup_nul)
+    return _splitmix64(hash(profil) & MASQUE_64)
+
+
+class TranspositionTable:
+    """
+    Table de transposition de taille bornée.
+    Chaque seau contient deux entrées : une entrée « profondeur d'abord » qui n'est remplacée que par une
+    recherche au moins aussi profonde, et une entrée « toujours remplacée » qui garde le résultat le plus récent.
+    Une entrée est un tuple (cle, profondeur, valeur, borne, meilleur_coup).
+    """
+    def __init__(self, nb_entrees=1 << 17, memoire_mo=None):
+        """
+        Fonction d'initialisation de la classe. Le budget est donné en nombre d'entrées ou en mégaoctets.
+        """
+        if memoire_mo is not None:
+            nb_entrees = int(memoire_mo * 1024 * 1024) // OCTETS_PAR_ENTREE
+        self.nb_seaux = max(1, nb_entrees // 2)
+        self._profondes = [None] * self.nb_seaux
+        self._recentes = [None] * self.nb_seaux
+        self.succes = 0
+        self.echecs = 0
+        self.ecrasements = 0
+        # entrées enregistrées depuis journaliser() (None = pas de journal), pour les copier dans un cache persistant
+        self.journal = None
+        self.profondeur_journal = 0
+        # entrées d'un cache persistant (cle -> (profondeur, valeur, borne, meilleur_coup, profil), voir
+        # CacheRecherche.brancher) consultées quand une clé n'est pas dans la table (None = pas de cache)
+        self.secours = None
+
+    def __len__(self):
+        return (sum(e is not None for e in self._profondes)
+                + sum(e is not None for e in self._recentes))
+
+    def clear(self):
+        """
+        Fonction vidant la table, remettant les compteurs à zéro et détachant le cache persistant.
+        """
+        self._profondes = [None] * self.nb_seaux
+        self._recentes = [None] * self.nb_seaux
+        self.succes = self.echecs = self.ecrasements = 0
+        self.secours = None
+
+    def lire(self, cle: int):
+        """
+        Fonction retournant l'entrée associée à la clé, ou None.
+        Une clé absente de la table est cherchée dans le cache persistant branché (secours) ; l'entrée trouvée est
+        alors copiée dans la table (sans passer par le journal, puisqu'elle vient du cache).
+        """
+        i = cle % self.nb_seaux
+        entree = self._profondes[i]
+        if entree is None or entree[0] != cle:
+            entree = self._recentes[i]
+            if entree is None or entree[0] != cle:
+                connue = self.secours.get(cle) if self.secours is not None else None
+                if connue is None:
+                    self.echecs += 1
+                    return None
+                profondeur, valeur, borne, meilleur_coup, _ = connue
+                entree = (cle, profondeur, valeur, borne, meilleur_coup)
+                self._placer(i, entree)
+        self.succes += 1
+        return entree
+
+    def enregistrer(self, cle: int, profondeur: int, valeur: float, borne: int, meilleur_coup=None):
+        """
+        Fonction enregistrant le résultat d'une recherche selon la politique de remplacement à deux entrées.
+        """
+        i = cle % self.nb_seaux
+        entree = (cle, profondeur, valeur, borne, meilleur_coup)
+        if self.journal is not None and profondeur >= self.profondeur_journal:
+            self.journal.append(entree)
+        self._placer(i, entree)
+
+    def _placer(self, i: int, entree: tuple):
+        """
+        Fonction rangeant une entrée dans le seau i : dans l'entrée « profondeur d'abord » si elle est au moins aussi
+        profonde (ou de même clé), sinon dans l'entrée « toujours remplacée ».
+        """
+        cle, profondeur = entree[0], entree[1]
+        ancienne = self._profondes[i]
+        if ancienne is None or ancienne[0] == cle or profondeur >= ancienne[1]:
+            if ancienne is not None and ancienne[0] != cle:
+                # l'ancienne entrée profonde n'est pas perdue : elle descend dans l'entrée toujours remplacée
+                if self._recentes[i] is not None:
+                    self.ecrasements += 1
+                self._recentes[i] = ancienne
+            self._profondes[i] = entree
+            return
+        recente = self._recentes[i]
+        if recente is not None and recente[0] != cle:
+            self.ecrasements += 1
+        self._recentes[i] = entree
+
+    def journaliser(self, profondeur_min=0):
+        """
+        Fonction démarrant le journal : les entrées de profondeur >= profondeur_min enregistrées ensuite sont aussi
+        gardées dans une liste, rendue par fin_journal.
+        """
+        self.journal = []
+        self.profondeur_journal = profondeur_min
+
+    def fin_journal(self) -> list:
+        """
+        Fonction arrêtant le journal et retournant les entrées enregistrées depuis journaliser().
+        """
+        journal, self.journal = self.journal, None
+        return journal or []
+
+    def statistiques(self) -> dict:
+        """
+        Fonction retournant les compteurs de la table (succès, échecs, écrasements, remplissage).
+        """
+        total = self.succes + self.echecs
+        return {
+            "succes": self.succes,
+            "echecs": self.echecs,
+            "taux_succes": self.succes / total if total else 0.0,
+            "ecrasements": self.ecrasements,
+            "entrees": len(self),
+            "capacite": 2 * self.nb_seaux,
+        }
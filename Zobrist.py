@@ -0,0 +1,56 @@
+MASQUE_64 = (1 << 64) - 1
+
+
+def _splitmix64(x: int) -> int:
+    """
+    Fonction de mélange splitmix64 : donne 64 bits pseudo-aléatoires à partir d'un entier.
+    Les clés ne dépendent d'aucun état global, elles sont donc identiques d'un processus à l'autre.
+    """
+    x = (x + 0x9E3779B97F4A7C15) & MASQUE_64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & MASQUE_64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & MASQUE_64
+    return x ^ (x >> 31)
+
+
+def tirage(cle: int, graine: int = 0) -> float:
+    """
+    Fonction retournant un nombre pseudo-aléatoire de [0, 1) qui ne dépend que de la clé et de la graine :
+    le même tirage est obtenu quel que soit l'ordre des appels, le processus ou l'état du module random.
+    """
+    return _splitmix64(cle ^ _splitmix64(graine & MASQUE_64)) / (1 << 64)
+
+
+class Zobrist:
+    """
+    Tables de clés de Zobrist 64 bits pour une taille de plateau : une clé par emplacement de mur (h et v),
+    par case et par joueur pour les pions, par nombre de murs restants et par joueur, plus une clé de trait.
+    Le hash d'un état est le XOR des clés de ses composantes, ce qui permet de le mettre à jour en O(1) par coup.
+    """
+    def __init__(self, taille: int):
+        nb_emplacements = (taille - 1) * (taille - 1)
+        nb_cases = taille * taille
+        compteur = [taille << 32]
+
+        def cle():
+            compteur[0] += 1
+            return _splitmix64(compteur[0])
+
+        self.murs_h = [cle() for _ in range(nb_emplacements)]
+        self.murs_v = [cle() for _ in range(nb_emplacements)]
+        self.pions = [[cle() for _ in range(nb_cases)] for _ in range(2)]
+        # nombre de murs restants : large marge au-delà du nombre d'emplacements du plateau
+        self.murs_restants = [[cle() for _ in range(2 * nb_emplacements + 2)] for _ in range(2)]
+        self.trait = cle()
+
+
+_TABLES = {}
+
+
+def tables_zobrist(taille: int) -> Zobrist:
+    """
+    Fonction retournant (et mettant en cache) les tables de Zobrist d'une taille de plateau.
+    """
+    tables = _TABLES.get(taille)
+    if tables is None:
+        tables = _TABLES[taille] = Zobrist(taille)
+    return tables
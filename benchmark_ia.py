@@ -2,16 +2,21 @@
 # benchmark_ia.py
 # Script pour lancer 50 parties IA contre IA avec différentes combinaisons de difficultés
 
+import argparse
+import json
+import os
 import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import numpy as np
 import matplotlib.pyplot as plt
 import pandas as pd
 import seaborn as sns
-from Object.Plateau import Plateau
-from Object.Joueur import Joueur
-from GameState import GameState, TRANSPOSITION_TABLE
+from PartieAuto import etat_initial, jouer_partie_auto, murs_par_defaut, verifier_variante
+from Recherche import StatistiquesRecherche
+from CacheRecherche import ouvrir_cache
 
-# Paramètres pour les différents niveaux d'IA
+# Paramètres pour les différents niveaux d'IA (clés décrites dans PartieAuto.py, avant PARAMETRES_CHOIX_COUP)
 IA_LEVELS = {
     "facile": {
         "profondeur": 1,
@@ -36,6 +41,35 @@ IA_LEVELS = {
         "poids_bloquer": 1,
         "poids_murs": 0.4,
         "poids_avance": 0.7
+    },
+    "difficile_pvs": {
+        "profondeur": 3,
+        "epsilon": 0.1,
+        "poids_avancer": 1.5,
+        "poids_bloquer": 1,
+        "poids_murs": 0.4,
+        "poids_avance": 0.7,
+        "pvs": True
+    },
+    "difficile_selectif": {
+        "profondeur": 4,
+        "epsilon": 0.1,
+        "poids_avancer": 1.5,
+        "poids_bloquer": 1,
+        "poids_murs": 0.4,
+        "poids_avance": 0.7,
+        "pvs": True,
+        "lmr": True,
+        "coup_nul": True
+    },
+    "mcts": {
+        "moteur": "mcts",
+        "iterations": 300,
+        "epsilon": 0,
+        "poids_avancer": 1.5,
+        "poids_bloquer": 1,
+        "poids_murs": 0.4,
+        "poids_avance": 0.7
     }
 }
 
@@ -49,27 +83,25 @@ COMBINATIONS = [
     ("difficile", "difficile")
 ]
 
+# Comparaisons de variantes du moteur, jouées seulement avec --experimentales (hors du benchmark standard)
+COMBINATIONS_EXPERIMENTALES = [
+    ("difficile", "mcts"),
+    ("difficile", "difficile_pvs"),
+    ("difficile", "difficile_selectif")
+]
+
 # Nombre de parties par combinaison
 NB_PARTIES = 50
 
-def initialiser_jeu():
+# Fichier où chaque partie terminée est ajoutée (une ligne JSON par partie) ; il permet de reprendre un benchmark
+# interrompu sans rejouer les parties déjà enregistrées
+FICHIER_RESULTATS = "resultats_benchmark.jsonl"
+
+def initialiser_jeu(taille=9, nb_murs=None):
     """Initialise un nouveau jeu de Quoridor"""
-    plateau = Plateau()
-    max_idx = 2 * plateau.taille - 2  # 16 si taille=9
-    mid = plateau.taille - 1  # 8
-    
-    # Instanciation des joueurs
-    joueurs = [
-        Joueur("1", (0, mid), max_idx),
-        Joueur("2", (max_idx, mid), 0)
-    ]
-    
-    for j in joueurs:
-        plateau.placer_joueur(j)
-    
-    return GameState(plateau, joueurs, 0)
+    return etat_initial(taille, nb_murs=nb_murs)
 
-def jouer_partie(niveau_ia1, niveau_ia2, max_coups=200):
+def jouer_partie(niveau_ia1, niveau_ia2, max_coups=200, graine=0, taille=9, nb_murs=None):
     """
     Joue une partie complète entre deux IAs de niveaux spécifiés
     
@@ -77,111 +109,168 @@ def jouer_partie(niveau_ia1, niveau_ia2, max_coups=200):
         niveau_ia1: niveau de l'IA 1 ("facile", "moyen", "difficile")
         niveau_ia2: niveau de l'IA 2 ("facile", "moyen", "difficile")
         max_coups: nombre maximum de coups avant match nul
+        graine: graine des choix aléatoires de la partie
+        taille, nb_murs: variante jouée (taille du plateau, murs par joueur)
     
     Returns:
         gagnant: "1", "2" ou None (match nul)
         nb_coups: nombre de coups joués
     """
-    # Vider la table de transposition pour chaque nouvelle partie
-    TRANSPOSITION_TABLE.clear()
-    
-    # Initialiser le jeu
-    state = initialiser_jeu()
-    
-    # Paramètres des IAs
-    params_ia = [IA_LEVELS[niveau_ia1], IA_LEVELS[niveau_ia2]]
+    partie = jouer_partie_auto(IA_LEVELS[niveau_ia1], IA_LEVELS[niveau_ia2], max_coups, graine, taille=taille,
+                               nb_murs=nb_murs)
+    return partie["gagnant"], partie["nb_coups"]
+
+def graine_partie(graine, niveau_ia1, niveau_ia2, partie):
+    """
+    Fonction retournant la graine aléatoire d'une partie : elle ne dépend que de la graine du benchmark, de la
+    combinaison et du numéro de la partie, pas de l'ordre dans lequel les processus jouent les parties.
+    """
+    return zlib.crc32(f"{graine}:{niveau_ia1}:{niveau_ia2}:{partie}".encode())
+
+def _jouer_partie_enregistrement(niveau_ia1, niveau_ia2, partie, graine, cache=None, taille=9, nb_murs=None):
+    """
+    Fonction exécutée dans un processus du pool : joue une partie avec sa graine et retourne l'enregistrement
+    à écrire dans le fichier de résultats. cache est le chemin du cache de recherche partagé (ou None).
+    """
+    debut = time.time()
+    enregistrement = jouer_partie_auto(IA_LEVELS[niveau_ia1], IA_LEVELS[niveau_ia2], graine=graine,
+                                       cache=ouvrir_cache(cache), taille=taille, nb_murs=nb_murs)
+    return {
+        "ia1": niveau_ia1,
+        "ia2": niveau_ia2,
+        "partie": partie,
+        "graine": graine,
+        "taille": taille,
+        "nb_murs": enregistrement["nb_murs"],
+        "gagnant": enregistrement["gagnant"],
+        "nb_coups": enregistrement["nb_coups"],
+        "duree": time.time() - debut,
+        "statistiques": enregistrement["statistiques"]
+    }
+
+def charger_resultats(fichier, taille=9, nb_murs=None, graine=0):
+    """
+    Fonction lisant les parties déjà enregistrées dans le fichier de résultats.
+    Une dernière ligne incomplète (arrêt brutal pendant l'écriture) est ignorée : la partie sera rejouée.
+    Seules les parties de la variante demandée (taille du plateau et murs par joueur) et de la graine du benchmark
+    sont gardées ; les enregistrements sans taille ni murs sont des parties sur le plateau standard.
+    Retourne un dictionnaire (ia1, ia2, partie) -> enregistrement.
+    """
+    nb_murs = verifier_variante(taille, nb_murs)
+    enregistrements = {}
+    if not os.path.exists(fichier):
+        return enregistrements
+    with open(fichier, encoding="utf-8") as f:
+        for ligne in f:
+            try:
+                enr = json.loads(ligne)
+            except json.JSONDecodeError:
+                continue
+            taille_enr = enr.get("taille", 9)
+            if (taille_enr, enr.get("nb_murs", murs_par_defaut(taille_enr))) != (taille, nb_murs):
+                continue
+            # une partie jouée avec une autre graine de benchmark n'est pas reprise
+            if enr.get("graine") != graine_partie(graine, enr["ia1"], enr["ia2"], enr["partie"]):
+                continue
+            enregistrements[(enr["ia1"], enr["ia2"], enr["partie"])] = enr
+    return enregistrements
+
+def agreger_resultats(enregistrements, nb_parties=NB_PARTIES, combinaisons=COMBINATIONS):
+    """
+    Fonction regroupant les parties enregistrées par combinaison, au format attendu par afficher_resultats.
+    La durée d'une combinaison est la somme des durées de ses parties (temps de calcul, pas temps écoulé).
+    Les statistiques de recherche de chaque IA sont cumulées sur les parties (StatistiquesRecherche).
+    """
+    resultats = {}
+    for niveau_ia1, niveau_ia2 in combinaisons:
+        parties = [enr for (n1, n2, i), enr in enregistrements.items()
+                   if n1 == niveau_ia1 and n2 == niveau_ia2 and i < nb_parties]
+        if not parties:
+            continue
+        statistiques = [StatistiquesRecherche(), StatistiquesRecherche()]
+        for enr in parties:
+            for stats, donnees in zip(statistiques, enr.get("statistiques", ())):
+                stats.ajouter(StatistiquesRecherche.depuis_dict(donnees))
+        resultats[(niveau_ia1, niveau_ia2)] = {
+            "victoires_ia1": sum(1 for enr in parties if enr["gagnant"] == "1"),
+            "victoires_ia2": sum(1 for enr in parties if enr["gagnant"] == "2"),
+            "matchs_nuls": sum(1 for enr in parties if enr["gagnant"] is None),
+            "coups_moyen": sum(enr["nb_coups"] for enr in parties) / len(parties),
+            "duree": sum(enr["duree"] for enr in parties),
+            "statistiques_ia1": statistiques[0],
+            "statistiques_ia2": statistiques[1]
+        }
+    return resultats
+
+def lancer_benchmark(workers=None, fichier=FICHIER_RESULTATS, graine=0, nb_parties=NB_PARTIES, cache=None, taille=9,
+                     nb_murs=None, combinaisons=COMBINATIONS):
+    """
+    Lance le benchmark et affiche les résultats.
+    Les parties sont réparties sur `workers` processus (None = nombre de coeurs, 1 = dans ce processus) et chaque
+    partie terminée est aussitôt ajoutée au fichier de résultats. Les parties déjà présentes dans le fichier
+    sont sautées : relancer la même commande reprend un benchmark interrompu.
+    cache est le chemin d'un cache de recherche persistant (CacheRecherche) partagé par les parties et les
+    exécutions : il accélère les recherches, mais comme ses entrées ne dépendent pas de la graine des parties, les
+    coups et les scores peuvent changer et les résultats ne sont plus reproductibles à partir de la graine seule.
+    taille et nb_murs choisissent la variante jouée ; un même fichier peut contenir des parties de plusieurs variantes.
+    combinaisons est la liste des paires de niveaux jouées (COMBINATIONS par défaut).
+    """
+    nb_murs = verifier_variante(taille, nb_murs)
+    print("Lancement du benchmark IA contre IA...")
+    print(f"Plateau {taille}x{taille}, {nb_murs} murs par joueur")
+    print(f"Nombre de parties par combinaison: {nb_parties}")
     
-    nb_coups = 0
+    enregistrements = charger_resultats(fichier, taille, nb_murs, graine)
+    a_jouer = [(niveau_ia1, niveau_ia2, i, graine_partie(graine, niveau_ia1, niveau_ia2, i), cache, taille, nb_murs)
+               for niveau_ia1, niveau_ia2 in combinaisons
+               for i in range(nb_parties)
+               if (niveau_ia1, niveau_ia2, i) not in enregistrements]
+    if len(a_jouer) < len(combinaisons) * nb_parties:
+        print(f"Reprise: {len(combinaisons) * nb_parties - len(a_jouer)} parties déjà enregistrées dans {fichier}")
     
-    # Boucle de jeu
-    while nb_coups < max_coups:
-        # Vérifier victoire
-        for j in state.joueurs:
-            if j.position[0] == j.ligne_obj:
-                return j.nom, nb_coups
+    with open(fichier, "a+", encoding="utf-8") as sortie:
+        # terminer une éventuelle ligne incomplète pour que la suivante reste lisible
+        if sortie.tell() > 0:
+            sortie.seek(sortie.tell() - 1)
+            if sortie.read(1) != "\n":
+                sortie.write("\n")
         
-        # Tour actuel
-        tour = state.tour
+        # parties jouées pendant cette exécution (enregistrements contient aussi les parties reprises du fichier)
+        jouees = [0]
         
-        # Paramètres de l'IA courante
-        params = params_ia[tour]
+        def enregistrer(enr):
+            sortie.write(json.dumps(enr) + "\n")
+            sortie.flush()
+            enregistrements[(enr["ia1"], enr["ia2"], enr["partie"])] = enr
+            jouees[0] += 1
+            if jouees[0] % 10 == 0:
+                print(f"  Partie {jouees[0]}/{len(a_jouer)}...")
         
-        # Choisir le meilleur coup
-        best_move = state.choix_coup(
-            profondeur=params["profondeur"],
-            IA_index=tour,
-            epsilon=params["epsilon"],
-            poids_avancer=params["poids_avancer"],
-            poids_bloquer=params["poids_bloquer"],
-            poids_murs=params["poids_murs"],
-            poids_avance=params["poids_avance"]
-        )
-        
-        # Si aucun coup n'est possible, c'est un match nul
-        if best_move is None:
-            print(f"  Aucun coup possible pour le joueur {tour+1}")
-            return None, nb_coups
-        
-        # Appliquer le coup
-        state = state.apply_move(best_move)
-        nb_coups += 1
-    
-    # Si on arrive ici, c'est un match nul
-    return None, nb_coups
-
-def lancer_benchmark():
-    """Lance le benchmark et affiche les résultats"""
-    print("Lancement du benchmark IA contre IA...")
-    print(f"Nombre de parties par combinaison: {NB_PARTIES}")
+        if workers == 1:
+            for taches in a_jouer:
+                enregistrer(_jouer_partie_enregistrement(*taches))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(_jouer_partie_enregistrement, *taches) for taches in a_jouer]
+                for future in as_completed(futures):
+                    enregistrer(future.result())
     
-    # Dictionnaire pour stocker les résultats
-    resultats = {}
+    resultats = agreger_resultats(enregistrements, nb_parties, combinaisons)
     
-    # Pour chaque combinaison de difficultés
-    for niveau_ia1, niveau_ia2 in COMBINATIONS:
+    # Afficher les résultats de chaque combinaison
+    for (niveau_ia1, niveau_ia2), res in resultats.items():
         print(f"\nTest: {niveau_ia1.capitalize()} vs {niveau_ia2.capitalize()}")
-        
-        # Initialiser les compteurs
-        victoires_ia1 = 0
-        victoires_ia2 = 0
-        matchs_nuls = 0
-        total_coups = 0
-        
-        debut = time.time()
-        
-        # Jouer les parties
-        for i in range(NB_PARTIES):
-            if (i + 1) % 10 == 0:
-                print(f"  Partie {i + 1}/{NB_PARTIES}...")
-            
-            gagnant, nb_coups = jouer_partie(niveau_ia1, niveau_ia2)
-            
-            if gagnant == "1":
-                victoires_ia1 += 1
-            elif gagnant == "2":
-                victoires_ia2 += 1
-            else:
-                matchs_nuls += 1
-            
-            total_coups += nb_coups
-        
-        duree = time.time() - debut
-        
-        # Stocker les résultats
-        resultats[(niveau_ia1, niveau_ia2)] = {
-            "victoires_ia1": victoires_ia1,
-            "victoires_ia2": victoires_ia2,
-            "matchs_nuls": matchs_nuls,
-            "coups_moyen": total_coups / NB_PARTIES,
-            "duree": duree
-        }
-        
-        # Afficher les résultats de cette combinaison
-        print(f"  Résultats: {niveau_ia1.capitalize()} a gagné {victoires_ia1} fois, "
-              f"{niveau_ia2.capitalize()} a gagné {victoires_ia2} fois, "
-              f"{matchs_nuls} matchs nuls")
-        print(f"  Nombre moyen de coups: {total_coups / NB_PARTIES:.1f}")
-        print(f"  Durée: {duree:.1f} secondes")
+        print(f"  Résultats: {niveau_ia1.capitalize()} a gagné {res['victoires_ia1']} fois, "
+              f"{niveau_ia2.capitalize()} a gagné {res['victoires_ia2']} fois, "
+              f"{res['matchs_nuls']} matchs nuls")
+        print(f"  Nombre moyen de coups: {res['coups_moyen']:.1f}")
+        print(f"  Durée: {res['duree']:.1f} secondes")
+        for nom, stats in ((niveau_ia1, res["statistiques_ia1"]), (niveau_ia2, res["statistiques_ia2"])):
+            if stats.recherches:
+                print(f"  {nom.capitalize()}: {stats.noeuds / stats.recherches:.0f} noeuds/coup, "
+                      f"{stats.noeuds_par_seconde:.0f} noeuds/s, table {stats.taux_succes_table:.0%}, "
+                      f"coupures au premier coup {stats.taux_premier_coup:.0%}, "
+                      f"génération {stats.temps_generation:.1f} s / évaluation {stats.temps_evaluation:.1f} s")
     
     return resultats
 
@@ -264,5 +353,19 @@ def afficher_resultats(resultats):
     plt.show()
 
 if __name__ == "__main__":
-    resultats = lancer_benchmark()
+    parser = argparse.ArgumentParser(description="Benchmark IA contre IA")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="nombre de processus (défaut: nombre de coeurs, 1: sans pool)")
+    parser.add_argument("--fichier", default=FICHIER_RESULTATS, help="fichier JSONL des résultats")
+    parser.add_argument("--graine", type=int, default=0, help="graine dont dérivent les graines des parties")
+    parser.add_argument("--parties", type=int, default=NB_PARTIES, help="nombre de parties par combinaison")
+    parser.add_argument("--cache", default=None, help="fichier du cache de recherche persistant (optionnel)")
+    parser.add_argument("--taille", type=int, default=9, help="taille du plateau (5 à 19)")
+    parser.add_argument("--murs", type=int, default=None, help="murs par joueur (défaut : taille + 1)")
+    parser.add_argument("--experimentales", action="store_true",
+                        help="jouer aussi les comparaisons de variantes du moteur (COMBINATIONS_EXPERIMENTALES)")
+    args = parser.parse_args()
+    combinaisons = COMBINATIONS + COMBINATIONS_EXPERIMENTALES if args.experimentales else COMBINATIONS
+    resultats = lancer_benchmark(args.workers, args.fichier, args.graine, args.parties, args.cache, args.taille,
+                                 args.murs, combinaisons)
     afficher_resultats(resultats)
@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+# benchmark_moteur.py
+# Micro-benchmark du moteur : temps des opérations de base de GameState sur un corpus fixe de positions de milieu
+# de partie, enregistrement en JSON et comparaison avec une référence.
+#
+#   python benchmark_moteur.py --sortie reference.json       # mesurer et enregistrer une référence
+#   python benchmark_moteur.py --reference reference.json    # mesurer et comparer (code retour 1 si régression)
+#   python benchmark_moteur.py --tailles 5 9 13 19            # évolution du coût avec la taille du plateau
+
+import argparse
+import json
+import math
+import platform
+import sys
+import time
+import tracemalloc
+from GameState import TRANSPOSITION_TABLE
+from PartieAuto import etat_initial
+from Recherche import ContexteRecherche
+
+# Débuts de parties Moyen contre Moyen ; les positions du corpus sont les positions après 6, 12 et 20 coups.
+# Les coups sont écrits en dur pour que le corpus ne change pas quand le moteur change.
+PARTIES = [
+    [
+        ('move', (2, 8)), ('move', (14, 8)), ('wall', 11, 7, 'h'), ('wall', 3, 9, 'h'),
+        ('move', (2, 6)), ('wall', 3, 5, 'h'), ('wall', 13, 9, 'v'), ('wall', 1, 3, 'v'),
+        ('wall', 13, 5, 'v'), ('wall', 3, 7, 'v'), ('move', (0, 6)), ('move', (16, 8)),
+        ('move', (0, 8)), ('move', (16, 10)), ('move', (0, 10)), ('move', (14, 10)),
+        ('move', (0, 12)), ('wall', 1, 13, 'h'), ('wall', 11, 11, 'h'), ('move', (12, 10)),
+    ],
+    [
+        ('move', (2, 8)), ('wall', 1, 5, 'v'), ('move', (4, 8)), ('wall', 3, 11, 'h'),
+        ('wall', 13, 7, 'h'), ('wall', 5, 9, 'h'), ('wall', 15, 5, 'v'), ('wall', 7, 5, 'v'),
+        ('move', (4, 6)), ('wall', 3, 3, 'v'), ('move', (6, 6)), ('wall', 7, 7, 'h'),
+        ('wall', 13, 9, 'v'), ('wall', 5, 7, 'v'), ('move', (4, 6)), ('wall', 5, 3, 'h'),
+        ('wall', 13, 11, 'v'), ('wall', 1, 7, 'v'), ('move', (4, 4)), ('wall', 7, 1, 'h'),
+    ],
+    [
+        ('move', (2, 8)), ('move', (14, 8)), ('move', (4, 8)), ('move', (12, 8)),
+        ('move', (6, 8)), ('move', (10, 8)), ('wall', 7, 7, 'h'), ('wall', 5, 9, 'v'),
+        ('wall', 9, 9, 'v'), ('wall', 5, 5, 'v'), ('wall', 13, 9, 'v'), ('move', (8, 8)),
+        ('wall', 9, 5, 'v'), ('wall', 3, 9, 'h'), ('move', (4, 8)), ('wall', 1, 5, 'v'),
+        ('wall', 9, 7, 'v'), ('wall', 7, 11, 'h'), ('move', (4, 6)), ('wall', 3, 7, 'v'),
+    ],
+    [
+        ('move', (2, 8)), ('move', (14, 8)), ('move', (4, 8)), ('move', (12, 8)),
+        ('move', (6, 8)), ('move', (10, 8)), ('wall', 7, 7, 'h'), ('wall', 5, 9, 'v'),
+        ('move', (4, 8)), ('wall', 5, 7, 'v'), ('wall', 9, 9, 'v'), ('wall', 1, 9, 'v'),
+        ('wall', 9, 5, 'v'), ('move', (12, 8)), ('wall', 9, 11, 'h'), ('wall', 3, 5, 'h'),
+        ('move', (2, 8)), ('move', (10, 8)), ('move', (0, 8)), ('move', (8, 8)),
+    ],
+]
+LONGUEURS = (6, 12, 20)
+
+# Paramètres d'évaluation utilisés pour evaluer et minimax (niveau "difficile")
+POIDS = (1.5, 1, 0.4, 0.7)
+
+# Profondeurs de minimax mesurées
+PROFONDEURS_MINIMAX = (2, 3)
+
+# Durée minimale d'une mesure (secondes) et nombre de mesures par opération (on garde la meilleure, la moins
+# perturbée par le reste de la machine)
+DUREE_MIN = 0.5
+REPETITIONS = 3
+
+# Baisse de débit (en proportion) au-delà de laquelle une mesure est signalée comme une régression
+SEUIL_REGRESSION = 0.10
+
+# Rapport d'échelle : tailles de plateau mesurées, nombre de coups joués par taille (partie de l'IA contre
+# elle-même depuis la position de départ) et profondeur de recherche de ces coups
+TAILLES_ECHELLE = (5, 7, 9, 11, 13, 15, 17, 19)
+COUPS_ECHELLE = 12
+PROFONDEUR_ECHELLE = 2
+
+def corpus():
+    """Retourne la liste des positions du corpus"""
+    positions = []
+    for coups in PARTIES:
+        for longueur in LONGUEURS:
+            state = etat_initial()
+            for coup in coups[:longueur]:
+                state.do_move(coup)
+            positions.append(state)
+    return positions
+
+def mesurer(operation, positions, duree_min=DUREE_MIN):
+    """
+    Exécute operation(position) sur toutes les positions, autant de tours que nécessaire pour durer au moins
+    duree_min secondes, et recommence REPETITIONS fois.
+    
+    Returns:
+        le meilleur nombre d'opérations par seconde
+    """
+    meilleur = 0
+    for _ in range(REPETITIONS):
+        nb_operations = 0
+        debut = time.perf_counter()
+        while True:
+            for position in positions:
+                operation(position)
+            nb_operations += len(positions)
+            duree = time.perf_counter() - debut
+            if duree >= duree_min:
+                break
+        meilleur = max(meilleur, nb_operations / duree)
+    return meilleur
+
+def _hash_complet(state):
+    """Calcule la clé de Zobrist sans utiliser la valeur mémorisée"""
+    state._hash = None
+    return state.get_hash()
+
+def _evaluation_complete(state):
+    """Évalue la position en recalculant les champs de distances au lieu de lire ceux mémorisés"""
+    state._champs = None
+    return state.evaluer(state.tour, *POIDS)
+
+def _minimax(state, profondeur):
+    """
+    Recherche minimax à profondeur fixe depuis une position, table de transposition vide pour que chaque mesure
+    parcoure le même arbre (la génération des coups ne dépend que de la position et de sa graine).
+    
+    Returns:
+        le nombre de noeuds visités
+    """
+    TRANSPOSITION_TABLE.clear()
+    contexte = ContexteRecherche()
+    state.minimax(profondeur, state.tour, -math.inf, math.inf, *POIDS, contexte=contexte)
+    return contexte.noeuds
+
+def lancer_mesures(duree_min=DUREE_MIN):
+    """
+    Mesure toutes les opérations sur le corpus.
+    
+    Returns:
+        dictionnaire nom -> {"ops_s": ...} (plus "noeuds_s" et "noeuds" pour minimax)
+    """
+    positions = corpus()
+    # un coup légal par position pour apply_move
+    coups = {id(state): state.get_legal_moves()[0] for state in positions}
+    
+    operations = {
+        "bfs": lambda s: [s.bfs(s.plateau, j.position, j.ligne_obj) for j in s.joueurs],
+        "calculer_chemin": lambda s: [s.calculer_chemin(s.plateau, j.position, j.ligne_obj) for j in s.joueurs],
+        "get_legal_moves": lambda s: s.get_legal_moves(),
+        "apply_move": lambda s: s.apply_move(coups[id(s)]),
+        "clone": lambda s: s.clone(),
+        "get_hash": _hash_complet,
+        "evaluer": _evaluation_complete,
+    }
+    resultats = {}
+    for nom, operation in operations.items():
+        resultats[nom] = {"ops_s": mesurer(operation, positions, duree_min)}
+    
+    for profondeur in PROFONDEURS_MINIMAX:
+        noeuds = sum(_minimax(state, profondeur) for state in positions)
+        ops_s = mesurer(lambda s: _minimax(s, profondeur), positions, duree_min)
+        resultats[f"minimax_p{profondeur}"] = {
+            "ops_s": ops_s,
+            "noeuds_s": ops_s * noeuds / len(positions),
+            "noeuds": noeuds
+        }
+    return resultats
+
+def _partie_echelle(taille, nb_coups, profondeur):
+    """
+    Joue nb_coups coups de l'IA contre elle-même (sans hasard) sur un plateau de la taille donnée, avec la table de
+    transposition dans l'état où l'appelant l'a laissée.
+    
+    Returns:
+        (liste des durées de recherche, liste des noeuds visités, liste des positions avant chaque coup)
+    """
+    state = etat_initial(taille)
+    durees, noeuds, positions = [], [], []
+    for _ in range(nb_coups):
+        if state.get_winner() is not None:
+            break
+        positions.append(state.clone())
+        contexte = ContexteRecherche()
+        debut = time.perf_counter()
+        coup = state.choix_coup(profondeur=profondeur, IA_index=state.tour, epsilon=0, poids_avancer=POIDS[0],
+                                poids_bloquer=POIDS[1], poids_murs=POIDS[2], poids_avance=POIDS[3],
+                                contexte=contexte)
+        durees.append(time.perf_counter() - debut)
+        noeuds.append(contexte.noeuds)
+        if coup is None:
+            break
+        state.do_move(coup)
+    return durees, noeuds, positions
+
+def mesurer_echelle(tailles=TAILLES_ECHELLE, nb_coups=COUPS_ECHELLE, profondeur=PROFONDEUR_ECHELLE,
+                    duree_min=DUREE_MIN):
+    """
+    Mesure, pour chaque taille de plateau, le coût du moteur sur une même partie de l'IA contre elle-même : noeuds
+    par seconde et latence des coups (moyenne et pire coup), débit de bfs et de get_legal_moves sur les positions
+    de la partie, et pic de mémoire allouée pendant la partie en plus de la table de transposition vide
+    (tracemalloc, mesuré sur une deuxième partie identique pour ne pas ralentir la première).
+    
+    Returns:
+        dictionnaire taille -> mesures
+    """
+    resultats = {}
+    for taille in tailles:
+        TRANSPOSITION_TABLE.clear()
+        durees, noeuds, positions = _partie_echelle(taille, nb_coups, profondeur)
+        TRANSPOSITION_TABLE.clear()
+        tracemalloc.start()
+        try:
+            _partie_echelle(taille, nb_coups, profondeur)
+            memoire = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        resultats[taille] = {
+            "coups": len(durees),
+            "noeuds_s": sum(noeuds) / sum(durees),
+            "latence_moy": sum(durees) / len(durees),
+            "latence_max": max(durees),
+            "noeuds_coup": sum(noeuds) / len(noeuds),
+            "bfs_ops_s": mesurer(lambda s: [s.bfs(s.plateau, j.position, j.ligne_obj) for j in s.joueurs],
+                                 positions, duree_min),
+            "get_legal_moves_ops_s": mesurer(lambda s: s.get_legal_moves(), positions, duree_min),
+            "memoire_ko": memoire / 1024,
+        }
+    return resultats
+
+def exposants_echelle(resultats):
+    """
+    Estime comment chaque coût croît avec la taille n du plateau : pente de log(coût) en fonction de log(n) entre la
+    plus petite et la plus grande taille mesurées (2 = quadratique, c'est-à-dire proportionnel au nombre de cases).
+    
+    Returns:
+        dictionnaire nom du coût -> exposant (vide si moins de deux tailles)
+    """
+    tailles = sorted(resultats)
+    if len(tailles) < 2:
+        return {}
+    petite, grande = resultats[tailles[0]], resultats[tailles[-1]]
+    rapport_tailles = math.log(tailles[-1] / tailles[0])
+    # les débits sont inversés pour obtenir des coûts par opération
+    couts = {
+        "temps par noeud": (1 / petite["noeuds_s"], 1 / grande["noeuds_s"]),
+        "latence par coup": (petite["latence_moy"], grande["latence_moy"]),
+        "bfs": (1 / petite["bfs_ops_s"], 1 / grande["bfs_ops_s"]),
+        "get_legal_moves": (1 / petite["get_legal_moves_ops_s"], 1 / grande["get_legal_moves_ops_s"]),
+        "mémoire": (petite["memoire_ko"], grande["memoire_ko"]),
+    }
+    return {nom: math.log(cout_grande / cout_petite) / rapport_tailles
+            for nom, (cout_petite, cout_grande) in couts.items()}
+
+def afficher_echelle(resultats):
+    """Affiche les mesures d'échelle et les exposants de croissance"""
+    print(f"{'Taille':<8}{'noeuds/s':>12}{'ms/coup':>10}{'ms pire':>10}{'noeuds/coup':>13}"
+          f"{'bfs/s':>12}{'coups/s':>12}{'ko':>8}")
+    for taille, mesure in sorted(resultats.items()):
+        print(f"{taille:<8}{mesure['noeuds_s']:>12.0f}{mesure['latence_moy'] * 1000:>10.1f}"
+              f"{mesure['latence_max'] * 1000:>10.1f}{mesure['noeuds_coup']:>13.0f}{mesure['bfs_ops_s']:>12.0f}"
+              f"{mesure['get_legal_moves_ops_s']:>12.0f}{mesure['memoire_ko']:>8.1f}")
+    exposants = exposants_echelle(resultats)
+    if exposants:
+        print("\nCroissance avec la taille n du plateau (coût ~ n^k, k < 2 : sous-quadratique)")
+        for nom, exposant in exposants.items():
+            print(f"  {nom:<18} k = {exposant:.2f}")
+
+def comparer(resultats, reference, seuil=SEUIL_REGRESSION):
+    """
+    Compare les débits mesurés avec ceux d'une référence.
+    
+    Returns:
+        liste de (nom, rapport nouveau/référence, régression) pour les mesures présentes des deux côtés
+    """
+    comparaison = []
+    for nom, mesure in resultats.items():
+        if nom not in reference:
+            continue
+        rapport = mesure["ops_s"] / reference[nom]["ops_s"]
+        comparaison.append((nom, rapport, rapport < 1 - seuil))
+    return comparaison
+
+def afficher_mesures(resultats, comparaison=None):
+    """Affiche les mesures (et la comparaison avec la référence)"""
+    rapports = {nom: (rapport, regression) for nom, rapport, regression in (comparaison or [])}
+    print(f"{'Opération':<18}{'ops/s':>14}{'noeuds/s':>14}{'vs réf.':>10}")
+    for nom, mesure in resultats.items():
+        noeuds_s = f"{mesure['noeuds_s']:>14.0f}" if "noeuds_s" in mesure else " " * 14
+        ligne = f"{nom:<18}{mesure['ops_s']:>14.1f}{noeuds_s}"
+        if nom in rapports:
+            rapport, regression = rapports[nom]
+            ligne += f"{rapport:>9.2f}x" + ("  RÉGRESSION" if regression else "")
+        print(ligne)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Micro-benchmark du moteur")
+    parser.add_argument("--sortie", help="fichier JSON où écrire les mesures")
+    parser.add_argument("--reference", help="fichier JSON d'une mesure précédente à comparer")
+    parser.add_argument("--seuil", type=float, default=SEUIL_REGRESSION,
+                        help="baisse de débit tolérée avant de signaler une régression (0.10 = 10%%)")
+    parser.add_argument("--duree", type=float, default=DUREE_MIN, help="durée minimale de chaque mesure (s)")
+    parser.add_argument("--tailles", type=int, nargs="*", default=None,
+                        help=f"rapport d'échelle sur ces tailles de plateau (sans valeur : {TAILLES_ECHELLE})")
+    parser.add_argument("--coups", type=int, default=COUPS_ECHELLE, help="coups joués par taille (rapport d'échelle)")
+    parser.add_argument("--profondeur", type=int, default=PROFONDEUR_ECHELLE,
+                        help="profondeur de recherche (rapport d'échelle)")
+    args = parser.parse_args()
+    
+    if args.tailles is not None:
+        echelle = mesurer_echelle(args.tailles or TAILLES_ECHELLE, args.coups, args.profondeur, args.duree)
+        afficher_echelle(echelle)
+        if args.sortie:
+            with open(args.sortie, "w", encoding="utf-8") as f:
+                json.dump({
+                    "python": platform.python_version(),
+                    "machine": platform.machine(),
+                    "coups": args.coups,
+                    "profondeur": args.profondeur,
+                    "echelle": echelle,
+                    "exposants": exposants_echelle(echelle)
+                }, f, indent=2)
+        sys.exit(0)
+    
+    resultats = lancer_mesures(args.duree)
+    
+    comparaison = None
+    if args.reference:
+        with open(args.reference, encoding="utf-8") as f:
+            comparaison = comparer(resultats, json.load(f)["resultats"], args.seuil)
+    afficher_mesures(resultats, comparaison)
+    
+    if args.sortie:
+        with open(args.sortie, "w", encoding="utf-8") as f:
+            json.dump({
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "positions": len(PARTIES) * len(LONGUEURS),
+                "resultats": resultats
+            }, f, indent=2)
+    
+    if comparaison and any(regression for _, _, regression in comparaison):
+        sys.exit(1)